@@ -2,45 +2,100 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime
+import hashlib
+from datetime import date
 from typing import Any
 
 import numpy as np
 import pandas as pd
 from loguru import logger
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.preprocessing import StandardScaler
 
 from .models import WorkoutResult
 
 
+_CATEGORICAL_COLUMNS = ("type", "workout_type", "weight_class")
+
+
 def results_to_dataframe(results: list[WorkoutResult]) -> pd.DataFrame:
-    """Convert a list of WorkoutResult models into a pandas DataFrame."""
-    records = []
-    for r in results:
-        records.append(
-            {
-                "id": r.id,
-                "date": r.date_parsed,
-                "distance_m": r.distance,
-                "time_seconds": r.time_seconds,
-                "type": r.type,
-                "workout_type": r.workout_type,
-                "pace_500m": r.pace_per_500m,
-                "stroke_rate": r.stroke_rate,
-                "calories": r.calories_total,
-                "heart_rate_avg": r.heart_rate.average if r.heart_rate else None,
-                "drag_factor": r.drag_factor,
-                "weight_class": r.weight_class,
-                "verified": r.verified,
-            }
-        )
-    df = pd.DataFrame(records)
-    if not df.empty:
-        df["date"] = pd.to_datetime(df["date"])
-        df.sort_values("date", inplace=True)
-        df.reset_index(drop=True, inplace=True)
+    """Convert a list of WorkoutResult models into a pandas DataFrame.
+
+    Columns are filled one array per field (struct-of-arrays) rather than
+    one dict per row, so pandas receives typed columns and skips inference.
+    """
+    n = len(results)
+    if n == 0:
+        logger.info("DataFrame created with 0 rows")
+        return pd.DataFrame()
+
+    ids = np.empty(n, dtype=np.int64)
+    distances = np.empty(n, dtype=np.int64)
+    times = np.empty(n, dtype=np.float64)
+    stroke_rates = np.empty(n, dtype=np.float64)
+    calories = np.empty(n, dtype=np.float64)
+    heart_rates = np.empty(n, dtype=np.float64)
+    drag_factors = np.empty(n, dtype=np.float64)
+    dates: list = [None] * n
+    types: list = [None] * n
+    workout_types: list = [None] * n
+    weight_classes: list = [None] * n
+    verified: list = [None] * n
+
+    nan = np.nan
+    for i, r in enumerate(results):
+        ids[i] = r.id
+        dates[i] = r.date
+        distances[i] = r.distance
+        times[i] = r.time
+        stroke_rates[i] = nan if r.stroke_rate is None else r.stroke_rate
+        calories[i] = nan if r.calories_total is None else r.calories_total
+        hr = r.heart_rate.average if r.heart_rate else None
+        heart_rates[i] = nan if hr is None else hr
+        drag_factors[i] = nan if r.drag_factor is None else r.drag_factor
+        types[i] = r.type
+        workout_types[i] = r.workout_type
+        weight_classes[i] = r.weight_class
+        verified[i] = r.verified
+
+    # Derived columns in one vectorised pass instead of per-row properties
+    times /= 10.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        paces = np.where(distances > 0, times / distances * 500, nan)
+
+    return columns_to_dataframe(
+        {
+            "id": ids,
+            "date": pd.to_datetime(dates, format="ISO8601"),
+            "distance_m": distances,
+            "time_seconds": times,
+            "type": types,
+            "workout_type": workout_types,
+            "pace_500m": paces,
+            "stroke_rate": stroke_rates,
+            "calories": calories,
+            "heart_rate_avg": heart_rates,
+            "drag_factor": drag_factors,
+            "weight_class": weight_classes,
+            "verified": verified,
+        }
+    )
+
+
+def columns_to_dataframe(columns: dict[str, Any]) -> pd.DataFrame:
+    """Assemble the workout DataFrame from ready-made columns.
+
+    Shared by ``results_to_dataframe`` and the SQLite loader so both
+    produce identical dtypes and row order.
+    """
+    df = pd.DataFrame(columns)
+    # Low-cardinality labels as categoricals: integer codes for
+    # value_counts/groupby instead of string hashing
+    for col in _CATEGORICAL_COLUMNS:
+        if col in df:
+            df[col] = df[col].astype("category")
+    df.sort_values("date", kind="stable", inplace=True)
+    df.reset_index(drop=True, inplace=True)
     logger.info(f"DataFrame created with {len(df)} rows")
     return df
 
@@ -50,84 +105,72 @@ def compute_summary(df: pd.DataFrame) -> dict[str, Any]:
     if df.empty:
         return {"total_workouts": 0}
 
-    total_distance_m = df["distance_m"].sum()
-    total_time_s = df["time_seconds"].sum()
+    total_distance_m, total_time_s = df[["distance_m", "time_seconds"]].sum()
+    pace = df["pace_500m"]
+    stroke_rate = df["stroke_rate"]
+    calories = df["calories"]
+    first_date = df["date"].min()
+    last_date = df["date"].max()
 
     summary = {
         "total_workouts": len(df),
         "total_distance_km": round(total_distance_m / 1000, 2),
         "total_time_hours": round(total_time_s / 3600, 2),
         "avg_distance_m": round(df["distance_m"].mean(), 0),
-        "avg_pace_500m": _format_pace(df["pace_500m"].mean()) if df["pace_500m"].notna().any() else "N/A",
-        "avg_stroke_rate": round(df["stroke_rate"].mean(), 1) if df["stroke_rate"].notna().any() else "N/A",
-        "avg_calories": round(df["calories"].mean(), 0) if df["calories"].notna().any() else "N/A",
-        "first_workout": df["date"].min().strftime("%Y-%m-%d"),
-        "last_workout": df["date"].max().strftime("%Y-%m-%d"),
-        "last_workout_display": df["date"].max().strftime("%d %b %Y"),
-        "days_since_last": (pd.Timestamp.now() - df["date"].max()).days,
+        "avg_pace_500m": "N/A" if pace.isna().all() else _format_pace(pace.mean()),
+        "avg_stroke_rate": "N/A" if stroke_rate.isna().all() else round(stroke_rate.mean(), 1),
+        "avg_calories": "N/A" if calories.isna().all() else round(calories.mean(), 0),
+        "first_workout": first_date.strftime("%Y-%m-%d"),
+        "last_workout": last_date.strftime("%Y-%m-%d"),
+        "last_workout_display": last_date.strftime("%d %b %Y"),
+        "days_since_last": days_since(last_date.strftime("%Y-%m-%d")),
         "workout_type_breakdown": df["workout_type"].value_counts().to_dict(),
     }
     return summary
 
 
-def monthly_volume(df: pd.DataFrame) -> pd.DataFrame:
-    """Aggregate total distance and time per month."""
-    if df.empty:
-        return pd.DataFrame()
-    monthly = df.copy()
-    monthly["month"] = monthly["date"].dt.to_period("M").astype(str)
-    agg = (
-        monthly.groupby("month")
-        .agg(
-            total_distance_km=("distance_m", lambda x: round(x.sum() / 1000, 2)),
-            total_time_hours=("time_seconds", lambda x: round(x.sum() / 3600, 2)),
-            workouts=("id", "count"),
-            avg_pace_500m=("pace_500m", "mean"),
-        )
-        .reset_index()
-    )
-    return agg
-
-
-def weekly_volume(df: pd.DataFrame) -> pd.DataFrame:
-    """Aggregate total distance and count per ISO week."""
-    if df.empty:
-        return pd.DataFrame()
-    weekly = df.copy()
-    weekly["week"] = weekly["date"].dt.isocalendar().week.astype(int)
-    weekly["year"] = weekly["date"].dt.isocalendar().year.astype(int)
-    weekly["year_week"] = weekly["year"].astype(str) + "-W" + weekly["week"].astype(str).str.zfill(2)
-    agg = (
-        weekly.groupby("year_week")
-        .agg(
-            total_distance_km=("distance_m", lambda x: round(x.sum() / 1000, 2)),
-            workouts=("id", "count"),
-        )
-        .reset_index()
-    )
-    return agg
+def days_since(day: str) -> int:
+    """Whole calendar days from ``day`` (YYYY-MM-DD) to today."""
+    return (date.today() - date.fromisoformat(day)).days
 
 
 def personal_bests(df: pd.DataFrame) -> dict[str, Any]:
     """Find personal bests across common benchmark distances."""
-    benchmarks: dict[str, list] = defaultdict(list)
+    benchmarks: dict[str, Any] = {}
     standard_distances = [2000, 5000, 6000, 10000, 21097, 42195]
+    if df.empty:
+        return benchmarks
 
-    for dist in standard_distances:
-        subset = df[df["distance_m"] == dist]
-        if not subset.empty:
-            best = subset.loc[subset["time_seconds"].idxmin()]
-            benchmarks[f"{dist}m"] = {
-                "time": _format_time(best["time_seconds"]),
-                "pace": _format_pace(best["pace_500m"]) if best["pace_500m"] else "N/A",
-                "date": best["date"].strftime("%Y-%m-%d"),
-            }
-    return dict(benchmarks)
+    # One grouped reduction instead of a boolean mask per distance
+    subset = df[df["distance_m"].isin(standard_distances)]
+    best_idx = subset.groupby("distance_m", observed=True)["time_seconds"].idxmin()
+    bests = df.loc[best_idx.values]
+
+    for best in bests.itertuples(index=False):
+        benchmarks[f"{int(best.distance_m)}m"] = {
+            "time": _format_time(best.time_seconds),
+            "pace": _format_pace(best.pace_500m) if best.pace_500m else "N/A",
+            "date": best.date.strftime("%Y-%m-%d"),
+        }
+    return benchmarks
 
 
 # ──────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────
+_EPOCH_MONDAY = np.datetime64("1970-01-05", "D")
+
+
+def _run_starts(keys: np.ndarray) -> np.ndarray:
+    """Start index of each run of equal consecutive values in ``keys``."""
+    return np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+
+
+def _run_sums(values: pd.Series, starts: np.ndarray) -> np.ndarray:
+    """Sum ``values`` over the runs beginning at ``starts``."""
+    return np.add.reduceat(values.to_numpy(dtype=np.float64), starts)
+
+
 def _format_pace(pace_seconds: float | None) -> str:
     """Format pace (seconds per 500m) into M:SS.T string."""
     if pace_seconds is None or pd.isna(pace_seconds):
@@ -137,6 +180,47 @@ def _format_pace(pace_seconds: float | None) -> str:
     return f"{minutes}:{seconds:04.1f}"
 
 
+def _format_paces(pace_seconds: np.ndarray) -> list[str]:
+    """Batch version of :func:`_format_pace` for an array of paces.
+
+    Same split (``divmod`` by 60) and the same ``%04.1f`` rounding as the
+    scalar version, so hover text matches the summary and PB cards.
+    """
+    paces = np.asarray(pace_seconds, dtype=np.float64)
+    minutes = np.floor_divide(paces, 60).astype(np.int64)
+    seconds = np.remainder(paces, 60)
+    return np.char.add(np.char.mod("%d:", minutes), np.char.mod("%04.1f", seconds)).tolist()
+
+
+def pace_ticks(paces: np.ndarray, step: int) -> tuple[list[int], list[str]]:
+    """M:SS tick values/labels every ``step`` s spanning ``paces``.
+
+    The range is snapped outward to 5 s, as on the original axes.
+    """
+    lo = (int(paces.min()) // 5) * 5
+    hi = (int(paces.max()) // 5 + 1) * 5
+    ticks = np.arange(lo, hi + 1, step)
+    mins, secs = np.divmod(ticks, 60)
+    labels = np.char.add(np.char.mod("%d:", mins), np.char.mod("%02d", secs))
+    return ticks.tolist(), labels.tolist()
+
+
+def _rolling_mean(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Trailing rolling mean via prefix sums (NaN-free input).
+
+    Equivalent to ``Series.rolling(window, min_periods).mean()`` but a
+    single cumsum plus one vectorised subtraction.
+    """
+    n = len(values)
+    prefix = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    end = np.arange(1, n + 1)
+    start = np.maximum(end - window, 0)
+    counts = end - start
+    means = (prefix[end] - prefix[start]) / counts
+    means[counts < min_periods] = np.nan
+    return means
+
+
 def _format_time(total_seconds: float) -> str:
     """Format total seconds into H:MM:SS.T string."""
     hours = int(total_seconds // 3600)
@@ -148,63 +232,91 @@ def _format_time(total_seconds: float) -> str:
     return f"{minutes}:{seconds:04.1f}"
 
 
+# ──────────────────────────────────────────────
+# Downsampling
+# ──────────────────────────────────────────────
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of ``n_out`` points chosen by Largest-Triangle-Three-Buckets.
+
+    ``x`` must be sorted ascending.  First and last points are always kept;
+    every bucket in between contributes the point forming the largest
+    triangle with the previous pick and the next bucket's centroid, which
+    preserves peaks and the overall shape of the series.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # n_out - 2 inner buckets over points 1..n-2, then the last point alone
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype(np.int64), n)
+
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0] = 0
+    picked[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = edges[i + 1], edges[i + 2]
+        cx = x[nxt_lo:nxt_hi].mean()
+        cy = y[nxt_lo:nxt_hi].mean()
+        area = np.abs(
+            (x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a])
+        )
+        a = lo + int(area.argmax())
+        picked[i + 1] = a
+    return picked
+
+
 # ──────────────────────────────────────────────
 # Training Heatmap
 # ──────────────────────────────────────────────
 def training_heatmap_data(df: pd.DataFrame) -> dict[str, Any]:
     """Build a week×weekday matrix of daily distance for a heatmap.
 
-    Returns dict with keys: z_values, weeks, days, height.
+    Returns dict with keys: z_values and date_labels (N weeks × 7 ndarrays),
+    weeks, days, height.
     """
     if df.empty:
         return {}
 
-    daily = df.copy()
-    daily["day"] = daily["date"].dt.date
-
-    daily_agg = (
-        daily.groupby("day")
-        .agg(total_meters=("distance_m", "sum"))
-        .reset_index()
-    )
-    daily_agg["day"] = pd.to_datetime(daily_agg["day"])
-
-    # Fill rest days with 0
-    all_days = pd.date_range(start=daily_agg["day"].min(), end=daily_agg["day"].max(), freq="D")
-    daily_full = daily_agg.set_index("day").reindex(all_days)
-    daily_full["total_meters"] = daily_full["total_meters"].fillna(0)
-    daily_full.index.name = "day"
-    daily_full = daily_full.reset_index()
-
-    # Build calendar matrix
-    daily_full["week_num"] = daily_full["day"].dt.isocalendar().week.astype(int)
-    daily_full["year"] = daily_full["day"].dt.isocalendar().year.astype(int)
-    daily_full["weekday"] = daily_full["day"].dt.isocalendar().day.astype(int)
-    daily_full["week_label"] = (
-        daily_full["year"].astype(str) + "-W" +
-        daily_full["week_num"].astype(str).str.zfill(2)
+    if not df["date"].is_monotonic_increasing:
+        df = df.sort_values("date")
+
+    # Rows are date-sorted, so each day is a contiguous run: sum the runs
+    # with reduceat instead of hashing a groupby key.
+    days = df["date"].to_numpy().astype("datetime64[D]")
+    starts = _run_starts(days)
+    daily_totals = _run_sums(df["distance_m"], starts)
+    unique_days = days[starts]
+
+    # Day numbers counted from a Monday give ISO week index and weekday
+    # with plain integer arithmetic.
+    day_num = (unique_days - _EPOCH_MONDAY).astype(np.int64)
+    first_week = day_num[0] // 7
+    n_weeks = int(day_num[-1] // 7 - first_week + 1)
+
+    z_matrix = np.zeros((n_weeks, 7), dtype=np.float64)
+    z_matrix[day_num // 7 - first_week, day_num % 7] = daily_totals
+
+    # Hover labels for every calendar day in range (rest days included)
+    all_days = np.arange(unique_days[0], unique_days[-1] + 1)
+    all_num = (all_days - _EPOCH_MONDAY).astype(np.int64)
+    date_matrix = np.full((n_weeks, 7), "", dtype=object)
+    date_matrix[all_num // 7 - first_week, all_num % 7] = (
+        pd.DatetimeIndex(all_days).strftime("%a %d %b %Y").to_numpy()
     )
 
-    matrix = daily_full.pivot_table(
-        index="week_label", columns="weekday",
-        values="total_meters", aggfunc="sum", fill_value=0,
-    )
-    # Build a matching matrix of date strings for hover
-    daily_full["date_str"] = daily_full["day"].dt.strftime("%a %d %b %Y")
-    date_matrix = daily_full.pivot_table(
-        index="week_label", columns="weekday",
-        values="date_str", aggfunc="first", fill_value="",
-    )
-    day_names = {1: "Mon", 2: "Tue", 3: "Wed", 4: "Thu", 5: "Fri", 6: "Sat", 7: "Sun"}
-    matrix.rename(columns=day_names, inplace=True)
-    date_matrix.rename(columns=day_names, inplace=True)
+    mondays = pd.DatetimeIndex(_EPOCH_MONDAY + (first_week + np.arange(n_weeks)) * 7)
+    weeks = mondays.strftime("%G-W%V")
 
     return {
-        "z_values": matrix.values.tolist(),
-        "date_labels": date_matrix.values.tolist(),
-        "weeks": matrix.index.tolist(),
-        "days": matrix.columns.tolist(),
-        "height": max(300, len(matrix) * 22),
+        "z_values": z_matrix,
+        "date_labels": date_matrix,
+        "weeks": weeks.tolist(),
+        "days": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+        "height": max(300, len(weeks) * 22),
     }
 
 
@@ -216,6 +328,8 @@ def pace_trend_regression(df: pd.DataFrame) -> dict[str, Any]:
 
     Returns dict with keys: dates, paces, trend_y, poly_y, rolling_avg,
     slope, r_squared, poly_r_squared, pace_change_per_month, improving.
+    The per-workout series (paces through rolling_avg) are float64
+    ndarrays; rolling_avg is NaN where the window is too short.
     """
     if df.empty or not df["pace_500m"].notna().any():
         return {}
@@ -224,35 +338,46 @@ def pace_trend_regression(df: pd.DataFrame) -> dict[str, Any]:
     first_day = pace_df["date"].min()
     pace_df["days_since_start"] = (pace_df["date"] - first_day).dt.days
 
-    x = pace_df["days_since_start"].values
-    y = pace_df["pace_500m"].values
-
-    # Linear regression (degree 1)
-    coefficients = np.polyfit(x, y, deg=1)
-    slope, intercept = coefficients[0], coefficients[1]
-    trend_y = np.polyval(coefficients, x)
-
-    ss_res = np.sum((y - trend_y) ** 2)
-    ss_tot = np.sum((y - np.mean(y)) ** 2)
+    x = pace_df["days_since_start"].to_numpy(dtype=np.float64)
+    y = pace_df["pace_500m"].to_numpy(dtype=np.float64)
+
+    # Linear regression (degree 1) — closed-form least squares
+    n = len(x)
+    sx, sy = x.sum(), y.sum()
+    sxx, sxy = np.dot(x, x), np.dot(x, y)
+    denom = n * sxx - sx * sx
+    slope = (n * sxy - sx * sy) / denom if denom else 0.0
+    intercept = (sy - slope * sx) / n
+    trend_y = slope * x + intercept
+
+    resid = y - trend_y
+    ss_res = resid @ resid
+    y_centered = y - sy / n
+    ss_tot = y_centered @ y_centered
     r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
 
-    # Polynomial regression (degree 3)
+    # Polynomial regression (degree 3) on a Vandermonde matrix built once;
+    # columns are scaled before the solve, as np.polyfit does.
     poly_deg = 3
-    poly_coeffs = np.polyfit(x, y, deg=poly_deg)
-    poly_y = np.polyval(poly_coeffs, x)
-
-    ss_res_poly = np.sum((y - poly_y) ** 2)
+    vander = np.vander(x, poly_deg + 1)
+    scale = np.sqrt((vander * vander).sum(axis=0))
+    scale[scale == 0] = 1.0
+    poly_coeffs, *_ = np.linalg.lstsq(vander / scale, y, rcond=None)
+    poly_y = vander @ (poly_coeffs / scale)
+
+    resid_poly = y - poly_y
+    ss_res_poly = resid_poly @ resid_poly
     poly_r_squared = 1 - (ss_res_poly / ss_tot) if ss_tot > 0 else 0
 
-    rolling_avg = pace_df["pace_500m"].rolling(window=10, min_periods=3).mean()
+    rolling_avg = _rolling_mean(y, window=10, min_periods=3)
 
     return {
         "dates": pace_df["date"].dt.strftime("%Y-%m-%d").tolist(),
-        "paces": y.tolist(),
-        "pace_formatted": [f"{int(s // 60)}:{s % 60:04.1f}" for s in y],
-        "trend_y": trend_y.tolist(),
-        "poly_y": poly_y.tolist(),
-        "rolling_avg": [None if pd.isna(v) else round(v, 2) for v in rolling_avg],
+        "paces": y,
+        "pace_formatted": _format_paces(y),
+        "trend_y": trend_y,
+        "poly_y": poly_y,
+        "rolling_avg": np.round(rolling_avg, 2),
         "slope": round(slope, 4),
         "r_squared": round(r_squared, 3),
         "poly_r_squared": round(poly_r_squared, 3),
@@ -265,6 +390,36 @@ def pace_trend_regression(df: pd.DataFrame) -> dict[str, Any]:
 # ──────────────────────────────────────────────
 # Workout Clustering (K-Means)
 # ──────────────────────────────────────────────
+_ELBOW_CACHE: dict[tuple[str, int, int], list[float]] = {}
+_ELBOW_CACHE_SIZE = 8
+
+# Distance (m) upper bounds of the Sprint … 10K Steady-State categories
+_CATEGORY_BOUNDS = np.array([4000, 6500, 8500, 10500], dtype=np.float64)
+
+
+def _elbow_inertias(X_scaled: np.ndarray, k_range: range) -> list[float]:
+    """Inertia per K for the elbow chart, cached on the scaled feature matrix.
+
+    The curve is only indicative, so MiniBatchKMeans with fewer restarts is
+    used here; the final clustering still runs full KMeans.
+    """
+    key = (hashlib.sha1(X_scaled.tobytes()).hexdigest(), k_range.start, k_range.stop)
+    cached = _ELBOW_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    inertias = []
+    for k in k_range:
+        km = MiniBatchKMeans(n_clusters=k, random_state=42, n_init=3, batch_size=256)
+        km.fit(X_scaled)
+        inertias.append(round(km.inertia_, 1))
+
+    if len(_ELBOW_CACHE) >= _ELBOW_CACHE_SIZE:
+        _ELBOW_CACHE.pop(next(iter(_ELBOW_CACHE)))
+    _ELBOW_CACHE[key] = inertias
+    return inertias
+
+
 def workout_clustering(df: pd.DataFrame, n_clusters: int = 4) -> dict[str, Any]:
     """Cluster workouts using K-Means, then present distance-based category profiles.
 
@@ -283,16 +438,15 @@ def workout_clustering(df: pd.DataFrame, n_clusters: int = 4) -> dict[str, Any]:
         return {}
 
     # ── Scale features (only the 3 core features — extras may have NaN) ──
+    # Hand sklearn a C-contiguous float64 block so neither StandardScaler nor
+    # KMeans makes its own layout-fixing copy.
+    X = np.ascontiguousarray(cluster_df[features].to_numpy(dtype=np.float64))
     scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(cluster_df[features])
+    X_scaled = scaler.fit_transform(X)
 
     # ── Elbow method (K=2..8) ──
     k_range = range(2, min(9, len(cluster_df)))
-    inertias = []
-    for k in k_range:
-        km = KMeans(n_clusters=k, random_state=42, n_init=10)
-        km.fit(X_scaled)
-        inertias.append(round(km.inertia_, 1))
+    inertias = _elbow_inertias(X_scaled, k_range)
 
     # ── Final K-Means clustering ──
     n_clusters = min(n_clusters, len(cluster_df))
@@ -301,12 +455,14 @@ def workout_clustering(df: pd.DataFrame, n_clusters: int = 4) -> dict[str, Any]:
     cluster_df["cluster"] = kmeans.labels_
 
     # ── K-Means cluster profiles (for scatter chart legend) ──
-    stats = cluster_df.groupby("cluster").agg(
+    stats = cluster_df.groupby("cluster", observed=True).agg(
         avg_distance=("distance_m", "mean"),
         avg_pace=("pace_500m", "mean"),
-        avg_duration_min=("time_seconds", lambda x: x.mean() / 60),
+        avg_duration_min=("time_seconds", "mean"),
         count=("distance_m", "count"),
-    ).round(1)
+    )
+    stats["avg_duration_min"] /= 60
+    stats = stats.round(1)
 
     def _label_for_centroid(avg_dist: float) -> str:
         if avg_dist < 4000:
@@ -350,28 +506,23 @@ def workout_clustering(df: pd.DataFrame, n_clusters: int = 4) -> dict[str, Any]:
     cluster_profiles.sort(key=lambda p: stats.loc[p["id"], "avg_distance"])
 
     # ── Distance-based category profiles (for cards & pie) ──
-    def _distance_category(dist_m: float) -> str:
-        if dist_m < 4000:
-            return "Sprint"
-        elif dist_m < 6500:
-            return "5K Steady-State"
-        elif dist_m < 8500:
-            return "Mid-Distance (5-10K)"
-        elif dist_m < 10500:
-            return "10K Steady-State"
-        else:
-            return "Endurance 10K+"
-
-    cluster_df["category"] = cluster_df["distance_m"].apply(_distance_category)
-    cat_stats = cluster_df.groupby("category").agg(
+    # Bucket every row at once: upper bounds are exclusive, as in
+    # "< 4000 m is a Sprint"
+    cat_order = ["Sprint", "5K Steady-State", "Mid-Distance (5-10K)",
+                 "10K Steady-State", "Endurance 10K+"]
+    bucket = np.searchsorted(
+        _CATEGORY_BOUNDS, cluster_df["distance_m"].to_numpy(dtype=np.float64), side="right"
+    )
+    cluster_df["category"] = np.asarray(cat_order, dtype=object)[bucket]
+    cat_stats = cluster_df.groupby("category", observed=True).agg(
         avg_distance=("distance_m", "mean"),
         avg_pace=("pace_500m", "mean"),
-        avg_duration_min=("time_seconds", lambda x: x.mean() / 60),
+        avg_duration_min=("time_seconds", "mean"),
         count=("distance_m", "count"),
-    ).round(1)
+    )
+    cat_stats["avg_duration_min"] /= 60
+    cat_stats = cat_stats.round(1)
 
-    cat_order = ["Sprint", "5K Steady-State", "Mid-Distance (5-10K)",
-                 "10K Steady-State", "Endurance 10K+"]
     category_profiles = []
     for cat in cat_order:
         if cat in cat_stats.index:
@@ -385,16 +536,26 @@ def workout_clustering(df: pd.DataFrame, n_clusters: int = 4) -> dict[str, Any]:
             })
 
     # ── Scatter data (uses K-Means cluster assignment) ──
-    scatter_data = []
-    for _, row in cluster_df.iterrows():
-        scatter_data.append({
-            "distance": row["distance_m"],
-            "pace": row["pace_500m"],
-            "time_min": round(row["time_seconds"] / 60, 1),
-            "stroke_rate": row["stroke_rate"] if pd.notna(row["stroke_rate"]) else None,
-            "calories": row["calories"] if pd.notna(row["calories"]) else None,
-            "cluster": int(row["cluster"]),
-        })
+    stroke_rates = cluster_df["stroke_rate"].astype(object).where(cluster_df["stroke_rate"].notna(), None)
+    calories = cluster_df["calories"].astype(object).where(cluster_df["calories"].notna(), None)
+    scatter_data = [
+        {
+            "distance": d,
+            "pace": p,
+            "time_min": round(t / 60, 1),
+            "stroke_rate": spm,
+            "calories": cal,
+            "cluster": c,
+        }
+        for d, p, t, spm, cal, c in zip(
+            cluster_df["distance_m"].tolist(),
+            cluster_df["pace_500m"].tolist(),
+            cluster_df["time_seconds"].tolist(),
+            stroke_rates.tolist(),
+            calories.tolist(),
+            cluster_df["cluster"].astype(int).tolist(),
+        )
+    ]
 
     return {
         "scatter_data": scatter_data,
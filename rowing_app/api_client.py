@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+from typing import AsyncIterator, Optional
 
 import httpx
 from loguru import logger
@@ -17,18 +18,63 @@ from .models import (
     WorkoutResult,
 )
 
+# Upper bound on concurrent page requests in get_all_results
+MAX_CONCURRENT_PAGES = 5
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build a pooled HTTP client for the Concept2 API.
+
+    Carries everything except the bearer token, so one instance can be
+    shared by every request (and user) for the life of the app.
+    """
+    return httpx.AsyncClient(
+        base_url=settings.c2_api_url,
+        headers={
+            "Content-Type": "application/json",
+            "Accept": f"application/vnd.c2logbook.{settings.c2_api_version}+json",
+        },
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=30.0,
+    )
+
 
 class Concept2Client:
-    """Async client for the Concept2 Logbook API."""
+    """Async client for the Concept2 Logbook API.
+
+    Pass ``client`` (see :func:`create_http_client`) to reuse an existing
+    connection pool; it is then left open by :meth:`aclose`.  Without it
+    the instance creates and owns a pool of its own.
+    """
 
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, client: Optional[httpx.AsyncClient] = None):
         self.access_token = access_token
         self.base_url = settings.c2_api_url
-        self._headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "Accept": f"application/vnd.c2logbook.{settings.c2_api_version}+json",
-        }
+        # Sent with every request rather than stored on the (possibly
+        # shared) client, which may be serving other users at once
+        self._headers = {"Authorization": f"Bearer {access_token}"}
+        self._owns_client = client is None
+        self._client = client if client is not None else create_http_client()
+
+    def set_access_token(self, access_token: str) -> None:
+        """Swap the bearer token in place (e.g. after a refresh).
+
+        Only the Authorization header changes; the pooled client and its
+        open connections are kept.
+        """
+        self.access_token = access_token
+        self._headers["Authorization"] = f"Bearer {access_token}"
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool, if this instance owns it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "Concept2Client":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     # ──────────────────────────────────────────
     # User
@@ -36,13 +82,9 @@ class Concept2Client:
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def get_user(self, user: str = "me") -> UserResponse:
         """Get user profile. Pass 'me' for authenticated user or an int id."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/users/{user}",
-                headers=self._headers,
-            )
-            resp.raise_for_status()
-            return UserResponse(**resp.json())
+        resp = await self._client.get(f"/users/{user}", headers=self._headers)
+        resp.raise_for_status()
+        return UserResponse.model_validate_json(resp.content)
 
     # ──────────────────────────────────────────
     # Results (workouts)
@@ -79,28 +121,29 @@ class Concept2Client:
         if updated_after:
             params["updated_after"] = updated_after
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/users/{user}/results",
-                headers=self._headers,
-                params=params,
-            )
-            resp.raise_for_status()
-            return ResultsResponse(**resp.json())
+        resp = await self._client.get(
+            f"/users/{user}/results",
+            params=params,
+            headers=self._headers,
+        )
+        resp.raise_for_status()
+        return ResultsResponse.model_validate_json(resp.content)
 
-    async def get_all_results(
+    async def iter_results(
         self,
         user: str = "me",
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
         workout_type: Optional[str] = None,
-    ) -> list[WorkoutResult]:
-        """Fetch ALL workout results, automatically handling pagination."""
-        all_results: list[WorkoutResult] = []
-        page = 1
+    ) -> AsyncIterator[list[WorkoutResult]]:
+        """Yield workout results one page at a time, in page order.
 
-        while True:
-            response = await self.get_results(
+        Page 1 reveals ``total_pages``; the remaining pages are then fetched
+        concurrently (at most ``MAX_CONCURRENT_PAGES`` in flight) while the
+        caller consumes earlier pages.
+        """
+        async def fetch_page(page: int) -> ResultsResponse:
+            return await self.get_results(
                 user=user,
                 page=page,
                 per_page=250,
@@ -108,16 +151,57 @@ class Concept2Client:
                 to_date=to_date,
                 workout_type=workout_type,
             )
-            all_results.extend(response.data)
-            logger.info(
-                f"Fetched page {page}/{response.meta.pagination.total_pages if response.meta else '?'} "
-                f"({len(all_results)} results so far)"
-            )
 
-            if response.meta and page < response.meta.pagination.total_pages:
-                page += 1
-            else:
-                break
+        first = await fetch_page(1)
+        total_pages = first.meta.pagination.total_pages if first.meta else 1
+        logger.info(
+            f"Fetched page 1/{total_pages if first.meta else '?'} "
+            f"({len(first.data)} results)"
+        )
+        yield first.data
+
+        if total_pages <= 1:
+            return
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        async def fetch_bounded(page: int) -> ResultsResponse:
+            async with semaphore:
+                return await fetch_page(page)
+
+        tasks = [
+            asyncio.create_task(fetch_bounded(page))
+            for page in range(2, total_pages + 1)
+        ]
+        try:
+            for page, task in enumerate(tasks, start=2):
+                response = await task
+                logger.info(
+                    f"Fetched page {page}/{total_pages} "
+                    f"({len(response.data)} results)"
+                )
+                yield response.data
+        finally:
+            # Consumer stopped early or a page failed: drop the rest
+            for task in tasks:
+                task.cancel()
+
+    async def get_all_results(
+        self,
+        user: str = "me",
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        workout_type: Optional[str] = None,
+    ) -> list[WorkoutResult]:
+        """Fetch ALL workout results, automatically handling pagination."""
+        all_results: list[WorkoutResult] = []
+        async for page in self.iter_results(
+            user=user,
+            from_date=from_date,
+            to_date=to_date,
+            workout_type=workout_type,
+        ):
+            all_results.extend(page)
 
         logger.success(f"Total results fetched: {len(all_results)}")
         return all_results
@@ -130,13 +214,11 @@ class Concept2Client:
         self, result_id: int, user: str = "me"
     ) -> SingleResultResponse:
         """Get a single workout result by ID."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/users/{user}/results/{result_id}",
-                headers=self._headers,
-            )
-            resp.raise_for_status()
-            return SingleResultResponse(**resp.json())
+        resp = await self._client.get(
+            f"/users/{user}/results/{result_id}", headers=self._headers
+        )
+        resp.raise_for_status()
+        return SingleResultResponse.model_validate_json(resp.content)
 
     # ──────────────────────────────────────────
     # Stroke Data
@@ -146,13 +228,11 @@ class Concept2Client:
         self, result_id: int, user: str = "me"
     ) -> StrokeDataResponse:
         """Get stroke-level data for a workout."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/users/{user}/results/{result_id}/strokes",
-                headers=self._headers,
-            )
-            resp.raise_for_status()
-            return StrokeDataResponse(**resp.json())
+        resp = await self._client.get(
+            f"/users/{user}/results/{result_id}/strokes", headers=self._headers
+        )
+        resp.raise_for_status()
+        return StrokeDataResponse.model_validate_json(resp.content)
 
     # ──────────────────────────────────────────
     # File export
@@ -165,10 +245,8 @@ class Concept2Client:
         user: str = "me",
     ) -> bytes:
         """Download a workout export (csv, fit, or tcx)."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/users/{user}/results/{result_id}/export/{file_type}",
-                headers=self._headers,
-            )
-            resp.raise_for_status()
-            return resp.content
+        resp = await self._client.get(
+            f"/users/{user}/results/{result_id}/export/{file_type}", headers=self._headers
+        )
+        resp.raise_for_status()
+        return resp.content
@@ -8,6 +8,24 @@ from loguru import logger
 from .config import settings
 from .models import TokenResponse
 
+# Shared client for token requests: keeps the connection to the OAuth
+# server alive across code exchanges and refreshes.  Opened and closed by
+# the app lifespan, so every startup gets a fresh one.
+_client: httpx.AsyncClient | None = None
+
+
+def open_http_client() -> None:
+    """Create the shared token-endpoint client (call on app startup)."""
+    global _client
+    _client = httpx.AsyncClient(timeout=15.0)
+
+
+def _token_client() -> httpx.AsyncClient:
+    """The shared client, opened on first use outside the app lifespan."""
+    if _client is None or _client.is_closed:
+        open_http_client()
+    return _client
+
 
 def get_authorization_url(state: str | None = None) -> str:
     """Build the Concept2 OAuth2 authorization URL.
@@ -38,16 +56,14 @@ async def exchange_code_for_token(code: str) -> TokenResponse:
         "redirect_uri": settings.c2_redirect_uri,
         "scope": settings.c2_scope,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            settings.c2_token_url,
-            data=payload,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-        response.raise_for_status()
-        data = response.json()
-        logger.info("Successfully obtained access token.")
-        return TokenResponse(**data)
+    response = await _token_client().post(
+        settings.c2_token_url,
+        data=payload,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    response.raise_for_status()
+    logger.info("Successfully obtained access token.")
+    return TokenResponse.model_validate_json(response.content)
 
 
 async def refresh_access_token(refresh_token: str) -> TokenResponse:
@@ -59,13 +75,19 @@ async def refresh_access_token(refresh_token: str) -> TokenResponse:
         "refresh_token": refresh_token,
         "scope": settings.c2_scope,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            settings.c2_token_url,
-            data=payload,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-        response.raise_for_status()
-        data = response.json()
-        logger.info("Successfully refreshed access token.")
-        return TokenResponse(**data)
+    response = await _token_client().post(
+        settings.c2_token_url,
+        data=payload,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    response.raise_for_status()
+    logger.info("Successfully refreshed access token.")
+    return TokenResponse.model_validate_json(response.content)
+
+
+async def close_http_client() -> None:
+    """Close the shared token-endpoint client (call on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
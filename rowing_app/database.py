@@ -10,15 +10,23 @@ Design:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import json
 import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+import numpy as np
+import pandas as pd
 from loguru import logger
 
+from .analytics import columns_to_dataframe
 from .api_client import Concept2Client
-from .models import WorkoutResult
+from .models import HeartRate, WorkoutResult
 
 import os
 
@@ -27,18 +35,160 @@ DB_PATH = Path(os.environ.get("DB_PATH", Path(__file__).resolve().parent.parent
 
 SYNC_INTERVAL = timedelta(hours=24)
 
+# Rows are bound in slices of this size so a full-history sync never
+# materialises every parameter tuple at once.
+UPSERT_BATCH_SIZE = 10_000
+
+# A sync writing more rows than this re-runs ANALYZE on the workouts table
+ANALYZE_THRESHOLD = 1000
+
+# Kept as one module-level object so every sync hits the connection's
+# prepared-statement cache instead of re-parsing the 26-column INSERT.
+_UPSERT_SQL = """
+    INSERT OR REPLACE INTO workouts (
+        id, user_id, date, timezone, date_utc,
+        distance, type, time, time_formatted,
+        workout_type, source, weight_class,
+        verified, ranked, comments, privacy,
+        stroke_rate, stroke_count, calories_total, drag_factor,
+        heart_rate_avg, heart_rate_min, heart_rate_max, heart_rate_end,
+        rest_time, rest_distance
+    ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
+# Per-month and per-ISO-week totals kept next to the rows they summarise.
+# Each SELECT is completed with a WHERE/GROUP BY by the caller; weeks are
+# keyed by their Monday, which SQLite can compute without %G/%V support.
+_MONTHLY_AGG_SELECT = """
+    SELECT substr(date, 1, 7), SUM(distance), SUM(time), COUNT(*),
+           SUM(CASE WHEN distance > 0 THEN time / 10.0 / distance * 500 END),
+           COUNT(CASE WHEN distance > 0 THEN 1 END)
+    FROM workouts
+"""
+_WEEKLY_AGG_SELECT = """
+    SELECT date(date, '-6 days', 'weekday 1'), SUM(distance), COUNT(*)
+    FROM workouts
+"""
+
+# Column list for load_workouts_as_models/iter_workout_dicts, in WorkoutResult field order,
+# plus a trailing ``has_hr`` flag computed by SQLite.
+# The aliases route the flags through the BOOLEAN converter even on
+# databases created when those columns were still declared INTEGER.
+_MODEL_COLUMNS = """
+    id, user_id, date, timezone, date_utc,
+    distance, type, time, time_formatted,
+    workout_type, source, weight_class,
+    verified AS "verified [BOOLEAN]", ranked AS "ranked [BOOLEAN]",
+    comments, privacy,
+    stroke_rate, stroke_count, calories_total, drag_factor,
+    heart_rate_avg, heart_rate_min, heart_rate_max, heart_rate_end,
+    rest_time, rest_distance,
+    (heart_rate_avg IS NOT NULL OR heart_rate_min IS NOT NULL
+     OR heart_rate_max IS NOT NULL OR heart_rate_end IS NOT NULL) AS has_hr
+"""
+
+# Keys for the first 20 _MODEL_COLUMNS, i.e. WorkoutResult fields up to
+# (but excluding) the nested heart_rate
+_DICT_KEYS = (
+    "id", "user_id", "date", "timezone", "date_utc",
+    "distance", "type", "time", "time_formatted",
+    "workout_type", "source", "weight_class",
+    "verified", "ranked", "comments", "privacy",
+    "stroke_rate", "stroke_count", "calories_total", "drag_factor",
+)
+
+# CSV export projection, named and formatted like the analytics DataFrame
+# was written: full timestamps, and nullable numeric columns as REAL so
+# they print as floats (``22.0``)
+_EXPORT_SQL = """
+    SELECT id, datetime(date) AS date,
+           distance AS distance_m,
+           time / 10.0 AS time_seconds,
+           type, workout_type,
+           CASE WHEN distance > 0 THEN time / 10.0 / distance * 500 END AS pace_500m,
+           CAST(stroke_rate AS REAL) AS stroke_rate,
+           CAST(calories_total AS REAL) AS calories,
+           CAST(heart_rate_avg AS REAL) AS heart_rate_avg,
+           CAST(drag_factor AS REAL) AS drag_factor,
+           weight_class,
+           verified AS "verified [BOOLEAN]"
+    FROM workouts
+    ORDER BY workouts.date ASC, id ASC
+"""
+
+# Flags are stored as 0/1; NULL never reaches a converter and stays None
+sqlite3.register_converter("BOOLEAN", lambda b: bool(int(b)))
+
 
 # ──────────────────────────────────────────────
 # Schema helpers
 # ──────────────────────────────────────────────
+_tls = threading.local()
+_all_connections: list[sqlite3.Connection] = []
+_all_connections_lock = threading.Lock()
+
+
+# Database paths whose schema init_db has already ensured in this process
+_initialized: set[str] = set()
+
+
 def _get_connection(db_path: Path = DB_PATH) -> sqlite3.Connection:
-    """Return a connection with Row factory for dict-like access."""
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    """Return this thread's cached connection for ``db_path``.
+
+    Connections are opened once per thread and reused, so back-to-back
+    reads on a page load skip the open/PRAGMA setup.  Callers must not
+    close them; they are closed at interpreter exit.
+    """
+    cache = getattr(_tls, "connections", None)
+    if cache is None:
+        cache = _tls.connections = {}
+    key = str(db_path)
+    conn = cache.get(key)
+    if conn is None:
+        conn = cache[key] = _open_connection(db_path)
+        with _all_connections_lock:
+            _all_connections.append(conn)
+    return conn
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    """Open a connection that returns plain tuples.
+
+    The connection runs in autocommit mode (``isolation_level=None``);
+    writers open explicit transactions themselves.
+    """
+    # check_same_thread=False so the atexit hook can close it and streamed
+    # exports can be advanced from any threadpool thread; a connection is
+    # never used by two threads at once.
+    conn = sqlite3.connect(
+        str(db_path),
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=256,
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+    )
     conn.execute("PRAGMA journal_mode=WAL")
+    # WAL + NORMAL only fsyncs at checkpoints, not on every commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
     return conn
 
 
+@atexit.register
+def _close_connections() -> None:
+    with _all_connections_lock:
+        for conn in _all_connections:
+            try:
+                # Cheap unless statistics have gone stale
+                conn.execute("PRAGMA optimize")
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _all_connections.clear()
+
+
 def init_db(db_path: Path = DB_PATH) -> None:
     """Create tables if they don't exist."""
     conn = _get_connection(db_path)
@@ -57,8 +207,8 @@ def init_db(db_path: Path = DB_PATH) -> None:
             workout_type    TEXT,
             source          TEXT,
             weight_class    TEXT,
-            verified        INTEGER,
-            ranked          INTEGER,
+            verified        BOOLEAN,
+            ranked          BOOLEAN,
             comments        TEXT,
             privacy         TEXT,
             stroke_rate     INTEGER,
@@ -76,89 +226,286 @@ def init_db(db_path: Path = DB_PATH) -> None:
         CREATE TABLE IF NOT EXISTS sync_meta (
             id              INTEGER PRIMARY KEY CHECK (id = 1),
             last_sync_utc   TEXT NOT NULL,
-            total_rows      INTEGER NOT NULL DEFAULT 0
+            total_rows      INTEGER NOT NULL DEFAULT 0,
+            latest_workout_date TEXT,
+            last_sync_unix  INTEGER
+        );
+
+        CREATE TABLE IF NOT EXISTS agg_monthly (
+            month           TEXT PRIMARY KEY,
+            distance_m      INTEGER NOT NULL,
+            time_tenths     INTEGER NOT NULL,
+            workouts        INTEGER NOT NULL,
+            pace_sum        REAL,
+            pace_count      INTEGER NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS agg_weekly (
+            week_start      TEXT PRIMARY KEY,
+            distance_m      INTEGER NOT NULL,
+            workouts        INTEGER NOT NULL
         );
 
         CREATE INDEX IF NOT EXISTS idx_workouts_date ON workouts(date);
         """
     )
+    _migrate_sync_meta(conn)
+    _backfill_aggregates(conn)
     conn.commit()
-    conn.close()
+    _initialized.add(str(db_path))
     logger.debug("Database initialised.")
 
 
+def _migrate_sync_meta(conn: sqlite3.Connection) -> None:
+    """Add ``sync_meta`` columns to databases created before they existed."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(sync_meta)")}
+    if "latest_workout_date" not in columns:
+        conn.execute("ALTER TABLE sync_meta ADD COLUMN latest_workout_date TEXT")
+        conn.execute(
+            "UPDATE sync_meta SET latest_workout_date = (SELECT MAX(date) FROM workouts)"
+        )
+        logger.info("Migrated sync_meta: added latest_workout_date")
+    if "last_sync_unix" not in columns:
+        conn.execute("ALTER TABLE sync_meta ADD COLUMN last_sync_unix INTEGER")
+        conn.execute(
+            "UPDATE sync_meta SET last_sync_unix = CAST(strftime('%s', last_sync_utc) AS INTEGER)"
+        )
+        logger.info("Migrated sync_meta: added last_sync_unix")
+
+
+def _backfill_aggregates(conn: sqlite3.Connection) -> None:
+    """Fill the aggregate tables on databases created before they existed."""
+    if conn.execute("SELECT 1 FROM agg_monthly LIMIT 1").fetchone():
+        return
+    if not conn.execute("SELECT 1 FROM workouts LIMIT 1").fetchone():
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(f"INSERT OR REPLACE INTO agg_monthly {_MONTHLY_AGG_SELECT} GROUP BY 1")
+        conn.execute(f"INSERT OR REPLACE INTO agg_weekly {_WEEKLY_AGG_SELECT} GROUP BY 1")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    logger.info("Backfilled monthly/weekly aggregate tables")
+
+
 # ──────────────────────────────────────────────
 # Write helpers
 # ──────────────────────────────────────────────
-def _upsert_workouts(conn: sqlite3.Connection, results: list[WorkoutResult]) -> int:
-    """Insert or replace workouts. Returns count of rows written."""
+def _row(r: WorkoutResult) -> tuple:
+    """Flatten a WorkoutResult into the ``workouts`` column order."""
+    hr = r.heart_rate
+    return (
+        r.id,
+        r.user_id,
+        r.date,
+        r.timezone,
+        r.date_utc,
+        r.distance,
+        r.type,
+        r.time,
+        r.time_formatted,
+        r.workout_type,
+        r.source,
+        r.weight_class,
+        1 if r.verified else 0 if r.verified is not None else None,
+        1 if r.ranked else 0 if r.ranked is not None else None,
+        r.comments,
+        r.privacy,
+        r.stroke_rate,
+        r.stroke_count,
+        r.calories_total,
+        r.drag_factor,
+        hr.average if hr else None,
+        hr.min if hr else None,
+        hr.max if hr else None,
+        hr.ending if hr else None,
+        r.rest_time,
+        r.rest_distance,
+    )
+
+
+def _write_workouts(conn: sqlite3.Connection, results: list[WorkoutResult]) -> int:
+    """Write workouts and bump the cached ``sync_meta`` totals.
+
+    Does no transaction control: the caller must hold an open write
+    transaction.  Returns count of rows written.
+    """
     if not results:
         return 0
 
-    rows = []
-    for r in results:
-        rows.append((
-            r.id,
-            r.user_id,
-            r.date,
-            r.timezone,
-            r.date_utc,
-            r.distance,
-            r.type,
-            r.time,
-            r.time_formatted,
-            r.workout_type,
-            r.source,
-            r.weight_class,
-            1 if r.verified else 0 if r.verified is not None else None,
-            1 if r.ranked else 0 if r.ranked is not None else None,
-            r.comments,
-            r.privacy,
-            r.stroke_rate,
-            r.stroke_count,
-            r.calories_total,
-            r.drag_factor,
-            r.heart_rate.average if r.heart_rate else None,
-            r.heart_rate.min if r.heart_rate else None,
-            r.heart_rate.max if r.heart_rate else None,
-            r.heart_rate.ending if r.heart_rate else None,
-            r.rest_time,
-            r.rest_distance,
-        ))
+    ids = json.dumps([r.id for r in results])
+    latest = max(r.date for r in results)
+
+    cur = conn.cursor()
+    try:
+        # Rows already present are replaced, not added; count them up front
+        # so total_rows can be bumped by the true delta.
+        existing = cur.execute(
+            "SELECT COUNT(*) FROM workouts WHERE id IN (SELECT value FROM json_each(?))",
+            (ids,),
+        ).fetchone()[0]
+        # Days whose totals change: where the rows land, and where any
+        # replaced rows used to be
+        days = {r.date[:10] for r in results}
+        days.update(
+            row[0] for row in cur.execute(
+                "SELECT DISTINCT substr(date, 1, 10) FROM workouts "
+                "WHERE id IN (SELECT value FROM json_each(?))",
+                (ids,),
+            )
+        )
+        for start in range(0, len(results), UPSERT_BATCH_SIZE):
+            batch = results[start:start + UPSERT_BATCH_SIZE]
+            cur.executemany(_UPSERT_SQL, (_row(r) for r in batch))
+        _refresh_aggregates(cur, days)
+        now_unix, now_utc = _sync_clock()
+        cur.execute(
+            """
+            INSERT INTO sync_meta (
+                id, last_sync_utc, last_sync_unix, total_rows, latest_workout_date
+            )
+            VALUES (1, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                total_rows = total_rows + excluded.total_rows,
+                latest_workout_date = MAX(
+                    COALESCE(latest_workout_date, ''),
+                    excluded.latest_workout_date
+                )
+            """,
+            (now_utc, now_unix, len(results) - existing, latest),
+        )
+    finally:
+        cur.close()
+    return len(results)
 
-    conn.executemany(
-        """
-        INSERT OR REPLACE INTO workouts (
-            id, user_id, date, timezone, date_utc,
-            distance, type, time, time_formatted,
-            workout_type, source, weight_class,
-            verified, ranked, comments, privacy,
-            stroke_rate, stroke_count, calories_total, drag_factor,
-            heart_rate_avg, heart_rate_min, heart_rate_max, heart_rate_end,
-            rest_time, rest_distance
-        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-        """,
-        rows,
+
+def _refresh_aggregates(cur: sqlite3.Cursor, days: set[str]) -> None:
+    """Recompute the monthly/weekly totals covering ``days`` (YYYY-MM-DD).
+
+    Each period is re-summed over its own date range, so the cost follows
+    the rows just written rather than the size of the table.
+    """
+    months = sorted({d[:7] for d in days})
+    mondays = sorted({
+        day - timedelta(days=day.weekday())
+        for day in (datetime.fromisoformat(d).date() for d in days)
+    })
+
+    cur.executemany("DELETE FROM agg_monthly WHERE month = ?", ((m,) for m in months))
+    cur.executemany(
+        f"INSERT INTO agg_monthly {_MONTHLY_AGG_SELECT} WHERE date >= ? AND date < ? GROUP BY 1",
+        ((m, _next_month(m)) for m in months),
     )
-    return len(rows)
+    cur.executemany(
+        "DELETE FROM agg_weekly WHERE week_start = ?", ((d.isoformat(),) for d in mondays)
+    )
+    cur.executemany(
+        f"INSERT INTO agg_weekly {_WEEKLY_AGG_SELECT} WHERE date >= ? AND date < ? GROUP BY 1",
+        ((d.isoformat(), (d + timedelta(days=7)).isoformat()) for d in mondays),
+    )
+
+
+def _next_month(month: str) -> str:
+    """``'2024-12'`` → ``'2025-01'``."""
+    year, mon = int(month[:4]), int(month[5:7])
+    return f"{year + mon // 12:04d}-{mon % 12 + 1:02d}"
+
+
+def store_workouts(results: list[WorkoutResult]) -> int:
+    """Write a full batch of fetched workouts and stamp the sync time.
+
+    Rows, cached totals and the sync timestamp commit together in one
+    write transaction.  Returns count of rows written.
+    """
+    conn = _get_connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        written = _write_workouts(conn, results)
+        _update_sync_meta(conn)
+        if written > ANALYZE_THRESHOLD:
+            conn.execute("ANALYZE workouts")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    conn.execute("PRAGMA optimize")
+    return written
+
+
+def _store_page(results: list[WorkoutResult]) -> int:
+    """Write one page of a sync in its own short write transaction."""
+    conn = _get_connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        written = _write_workouts(conn, results)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return written
+
+
+def _finish_sync(written: int) -> None:
+    """Stamp the sync time once every page of a sync has been written."""
+    conn = _get_connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        _update_sync_meta(conn)
+        if written > ANALYZE_THRESHOLD:
+            # Bulk load: refresh planner statistics before readers arrive
+            conn.execute("ANALYZE workouts")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    conn.execute("PRAGMA optimize")
+
+
+def _rewind_sync(latest_date: Optional[str]) -> None:
+    """Undo the progress markers of a sync that failed part-way.
+
+    Pages already committed stay (re-writing them is idempotent), but the
+    next sync must start from ``latest_date`` again rather than from the
+    newest row that made it in; a failed first sync is also left due.
+    """
+    conn = _get_connection()
+    if latest_date is None:
+        conn.execute(
+            "UPDATE sync_meta SET latest_workout_date = NULL, last_sync_unix = NULL WHERE id = 1"
+        )
+    else:
+        conn.execute(
+            "UPDATE sync_meta SET latest_workout_date = ? WHERE id = 1", (latest_date,)
+        )
 
 
 def _update_sync_meta(conn: sqlite3.Connection) -> None:
-    """Update the sync timestamp and row count."""
-    now_utc = datetime.now(timezone.utc).isoformat()
-    total = conn.execute("SELECT COUNT(*) FROM workouts").fetchone()[0]
+    """Update the sync timestamp.
+
+    ``total_rows`` and ``latest_workout_date`` are maintained by
+    ``_write_workouts`` in the same transaction as the rows themselves.
+    """
+    now_unix, now_utc = _sync_clock()
     conn.execute(
         """
-        INSERT INTO sync_meta (id, last_sync_utc, total_rows)
+        INSERT INTO sync_meta (id, last_sync_utc, last_sync_unix)
         VALUES (1, ?, ?)
         ON CONFLICT(id) DO UPDATE SET
             last_sync_utc = excluded.last_sync_utc,
-            total_rows = excluded.total_rows
+            last_sync_unix = excluded.last_sync_unix
         """,
-        (now_utc, total),
+        (now_utc, now_unix),
     )
 
 
+def _sync_clock() -> tuple[int, str]:
+    """Current time as (Unix seconds, ISO-8601 UTC string)."""
+    now = time.time()
+    return int(now), datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+
+
 # ──────────────────────────────────────────────
 # Read helpers
 # ──────────────────────────────────────────────
@@ -166,41 +513,81 @@ def get_last_sync() -> Optional[datetime]:
     """Return the last sync timestamp (UTC) or None if never synced."""
     conn = _get_connection()
     row = conn.execute(
-        "SELECT last_sync_utc FROM sync_meta WHERE id = 1"
+        "SELECT last_sync_unix FROM sync_meta WHERE id = 1"
     ).fetchone()
-    conn.close()
-    if row:
-        return datetime.fromisoformat(row["last_sync_utc"])
+    if row and row[0] is not None:
+        return datetime.fromtimestamp(row[0], tz=timezone.utc)
     return None
 
 
 def needs_sync() -> bool:
     """Return True if a sync is needed (never synced, or >24 h ago)."""
-    last = get_last_sync()
-    if last is None:
+    conn = _get_connection()
+    row = conn.execute(
+        "SELECT last_sync_unix FROM sync_meta WHERE id = 1"
+    ).fetchone()
+    if not row or row[0] is None:
         return True
-    elapsed = datetime.now(timezone.utc) - last
-    return elapsed >= SYNC_INTERVAL
+    return time.time() - row[0] >= SYNC_INTERVAL.total_seconds()
+
+
+def get_data_version() -> Optional[tuple]:
+    """Return a stamp that changes whenever the stored workouts change.
+
+    Every write path updates ``sync_meta``, so its (sync time, row count)
+    pair is enough to key caches derived from the table.
+    """
+    conn = _get_connection()
+    row = conn.execute(
+        "SELECT last_sync_utc, total_rows FROM sync_meta WHERE id = 1"
+    ).fetchone()
+    return tuple(row) if row else None
 
 
 def get_latest_workout_date() -> Optional[str]:
     """Return the date string of the most recent workout in the DB."""
     conn = _get_connection()
     row = conn.execute(
-        "SELECT date FROM workouts ORDER BY date DESC LIMIT 1"
+        "SELECT latest_workout_date FROM sync_meta WHERE id = 1"
     ).fetchone()
-    conn.close()
-    if row:
-        return row["date"][:10]  # YYYY-MM-DD
+    if row and row[0]:
+        return row[0][:10]  # YYYY-MM-DD
     return None
 
 
 def get_workout_count() -> int:
     """Return total number of workouts stored locally."""
     conn = _get_connection()
-    count = conn.execute("SELECT COUNT(*) FROM workouts").fetchone()[0]
-    conn.close()
-    return count
+    row = conn.execute("SELECT total_rows FROM sync_meta WHERE id = 1").fetchone()
+    return row[0] if row else 0
+
+
+def _date_range_clause(
+    from_date: Optional[str],
+    to_date: Optional[str],
+) -> tuple[str, list]:
+    """Build a ``date`` filter as a half-open range ``[from, to + 1 day)``.
+
+    Bare comparisons on the column keep ``idx_workouts_date`` usable as a
+    range scan; ``to_date`` is inclusive of the whole day.  A ``to_date``
+    that is not an ISO date falls back to a plain string bound, as the
+    dates are only ever compared as strings.
+    """
+    clauses = ["1=1"]
+    params: list = []
+    if from_date:
+        clauses.append("date >= ?")
+        params.append(from_date)
+    if to_date:
+        try:
+            next_day = (datetime.fromisoformat(to_date) + timedelta(days=1)).date().isoformat()
+        except ValueError:
+            clauses.append("date <= ?")
+            params.append(to_date + " 23:59:59")
+        else:
+            clauses.append("date < ?")
+            params.append(next_day)
+    return " AND ".join(clauses), params
 
 
 def load_workouts_as_models(
@@ -209,69 +596,286 @@ def load_workouts_as_models(
 ) -> list[WorkoutResult]:
     """Load workouts from SQLite and return as WorkoutResult models.
 
-    This is what the dashboard uses instead of calling the API.
+    Kept for callers that want models; the dashboard and the API
+    endpoints read :func:`load_workouts_as_frame` / :func:`iter_workout_dicts`.
     """
     conn = _get_connection()
-    query = "SELECT * FROM workouts WHERE 1=1"
-    params: list = []
-
-    if from_date:
-        query += " AND date >= ?"
-        params.append(from_date)
-    if to_date:
-        query += " AND date <= ?"
-        params.append(to_date + " 23:59:59")
-
-    query += " ORDER BY date ASC"
-    rows = conn.execute(query, params).fetchall()
-    conn.close()
+    where, params = _date_range_clause(from_date, to_date)
+    query = f"SELECT {_MODEL_COLUMNS} FROM workouts WHERE {where} ORDER BY date ASC"
 
     results: list[WorkoutResult] = []
-    for row in rows:
+    # Iterate the cursor so rows stream from SQLite instead of being
+    # materialised as a list of tuples next to the list of models.
+    for (
+        id_, user_id, date, tz, date_utc,
+        distance, type_, time_, time_formatted,
+        workout_type, source, weight_class,
+        verified, ranked, comments, privacy,
+        stroke_rate, stroke_count, calories_total, drag_factor,
+        hr_avg, hr_min, hr_max, hr_end,
+        rest_time, rest_distance, has_hr,
+    ) in conn.execute(query, params):
         hr_data = None
-        if any(row[k] is not None for k in ("heart_rate_avg", "heart_rate_min",
-                                              "heart_rate_max", "heart_rate_end")):
-            from .models import HeartRate
-            hr_data = HeartRate(
-                average=row["heart_rate_avg"],
-                min=row["heart_rate_min"],
-                max=row["heart_rate_max"],
-                ending=row["heart_rate_end"],
+        if has_hr:
+            hr_data = HeartRate.model_construct(
+                average=hr_avg, min=hr_min, max=hr_max, ending=hr_end
             )
 
-        results.append(WorkoutResult(
-            id=row["id"],
-            user_id=row["user_id"],
-            date=row["date"],
-            timezone=row["timezone"],
-            date_utc=row["date_utc"],
-            distance=row["distance"],
-            type=row["type"],
-            time=row["time"],
-            time_formatted=row["time_formatted"],
-            workout_type=row["workout_type"],
-            source=row["source"],
-            weight_class=row["weight_class"],
-            verified=bool(row["verified"]) if row["verified"] is not None else None,
-            ranked=bool(row["ranked"]) if row["ranked"] is not None else None,
-            comments=row["comments"],
-            privacy=row["privacy"],
-            stroke_rate=row["stroke_rate"],
-            stroke_count=row["stroke_count"],
-            calories_total=row["calories_total"],
-            drag_factor=row["drag_factor"],
+        # Values come from our own typed schema: skip pydantic validation
+        results.append(WorkoutResult.model_construct(
+            id=id_,
+            user_id=user_id,
+            date=date,
+            timezone=tz,
+            date_utc=date_utc,
+            distance=distance,
+            type=type_,
+            time=time_,
+            time_formatted=time_formatted,
+            workout_type=workout_type,
+            source=source,
+            weight_class=weight_class,
+            verified=verified,
+            ranked=ranked,
+            comments=comments,
+            privacy=privacy,
+            stroke_rate=stroke_rate,
+            stroke_count=stroke_count,
+            calories_total=calories_total,
+            drag_factor=drag_factor,
             heart_rate=hr_data,
-            rest_time=row["rest_time"],
-            rest_distance=row["rest_distance"],
+            rest_time=rest_time,
+            rest_distance=rest_distance,
         ))
 
     logger.info(f"Loaded {len(results)} workouts from local DB")
     return results
 
 
+def iter_workout_dicts(
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    batch_size: int = 1000,
+) -> Iterator:
+    """Yield the matching row count, then batches of workout dicts.
+
+    Dicts are shaped like ``WorkoutResult.model_dump()``.  Count and rows
+    are read in one transaction, so they agree even if a sync commits
+    mid-stream.  Runs on its own connection for the same reason as
+    :func:`iter_export_rows`.
+    """
+    conn = _open_connection(DB_PATH)
+    where, params = _date_range_clause(from_date, to_date)
+    try:
+        conn.execute("BEGIN")
+        yield conn.execute(f"SELECT COUNT(*) FROM workouts WHERE {where}", params).fetchone()[0]
+        cur = conn.execute(
+            f"SELECT {_MODEL_COLUMNS} FROM workouts WHERE {where} ORDER BY date ASC", params
+        )
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            yield [_row_to_dict(row) for row in rows]
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def _row_to_dict(row: tuple) -> dict:
+    """Turn a ``_MODEL_COLUMNS`` row into a ``model_dump()``-shaped dict."""
+    data = dict(zip(_DICT_KEYS, row[:20]))
+    data["heart_rate"] = {
+        "average": row[20], "min": row[21], "max": row[22], "ending": row[23],
+        "recovery": None, "rest": None,
+    } if row[26] else None
+    data["rest_time"] = row[24]
+    data["rest_distance"] = row[25]
+    return data
+
+
+def load_workouts_as_frame(
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> pd.DataFrame:
+    """Load workouts straight into the analytics DataFrame.
+
+    Selects only the columns the dashboard uses and builds typed arrays
+    from the transposed rows, skipping per-row model construction.  The
+    result matches ``results_to_dataframe(load_workouts_as_models(...))``.
+    """
+    conn = _get_connection()
+    where, params = _date_range_clause(from_date, to_date)
+    query = f"""
+        SELECT id, date, distance, time, type, workout_type, stroke_rate,
+               calories_total, heart_rate_avg, drag_factor, weight_class,
+               verified AS "verified [BOOLEAN]"
+        FROM workouts WHERE {where}
+        ORDER BY date ASC, id ASC
+    """
+    rows = conn.execute(query, params).fetchall()
+    logger.info(f"Loaded {len(rows)} workout rows from local DB")
+    if not rows:
+        return pd.DataFrame()
+
+    (ids, dates, distances, times, types, workout_types, stroke_rates,
+     calories, heart_rates, drag_factors, weight_classes, verified) = zip(*rows)
+
+    distance_m, time_seconds, pace = _distance_time_pace(distances, times)
+
+    return columns_to_dataframe(
+        {
+            "id": np.array(ids, dtype=np.int64),
+            "date": pd.to_datetime(dates, format="ISO8601"),
+            "distance_m": distance_m,
+            "time_seconds": time_seconds,
+            "type": types,
+            "workout_type": workout_types,
+            "pace_500m": pace,
+            # None → NaN on float conversion
+            "stroke_rate": np.array(stroke_rates, dtype=np.float64),
+            "calories": np.array(calories, dtype=np.float64),
+            "heart_rate_avg": np.array(heart_rates, dtype=np.float64),
+            "drag_factor": np.array(drag_factors, dtype=np.float64),
+            "weight_class": weight_classes,
+            "verified": list(verified),
+        }
+    )
+
+
+def load_monthly_volume(
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> pd.DataFrame:
+    """Monthly totals, aggregated by SQLite.
+
+    One row per month: total_distance_km, total_time_hours, workouts and
+    avg_pace_500m.  The full history reads ``agg_monthly``; a date range
+    is grouped on the fly over an index range scan.
+    """
+    conn = _get_connection()
+    if from_date or to_date:
+        where, params = _date_range_clause(from_date, to_date)
+        rows = conn.execute(
+            f"{_MONTHLY_AGG_SELECT} WHERE {where} GROUP BY 1 ORDER BY 1", params
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT month, distance_m, time_tenths, workouts, pace_sum, pace_count "
+            "FROM agg_monthly ORDER BY month"
+        ).fetchall()
+    if not rows:
+        return pd.DataFrame()
+
+    months, distances, times, counts, pace_sums, pace_counts = zip(*rows)
+    pace_sum = np.array(pace_sums, dtype=np.float64)
+    pace_count = np.array(pace_counts, dtype=np.int64)
+    return pd.DataFrame(
+        {
+            "month": list(months),
+            "total_distance_km": np.array(distances, dtype=np.float64) / 1000,
+            "total_time_hours": np.array(times, dtype=np.float64) / 10 / 3600,
+            "workouts": np.array(counts, dtype=np.int64),
+            "avg_pace_500m": np.divide(
+                pace_sum, pace_count,
+                out=np.full(len(rows), np.nan), where=pace_count > 0,
+            ),
+        }
+    ).round({"total_distance_km": 2, "total_time_hours": 2})
+
+
+def load_weekly_volume(
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> pd.DataFrame:
+    """ISO-week totals, aggregated by SQLite.
+
+    One row per ISO week (``year_week``): total_distance_km and workouts.
+    Sourced like :func:`load_monthly_volume`.
+    """
+    conn = _get_connection()
+    if from_date or to_date:
+        where, params = _date_range_clause(from_date, to_date)
+        rows = conn.execute(
+            f"{_WEEKLY_AGG_SELECT} WHERE {where} GROUP BY 1 ORDER BY 1", params
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT week_start, distance_m, workouts FROM agg_weekly ORDER BY week_start"
+        ).fetchall()
+    if not rows:
+        return pd.DataFrame()
+
+    weeks, distances, counts = zip(*rows)
+    return pd.DataFrame(
+        {
+            "year_week": pd.to_datetime(weeks, format="%Y-%m-%d").strftime("%G-W%V"),
+            "total_distance_km": np.array(distances, dtype=np.float64) / 1000,
+            "workouts": np.array(counts, dtype=np.int64),
+        }
+    ).round({"total_distance_km": 2})
+
+
+def _distance_time_pace(
+    distances: tuple, times: tuple
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Distance (m), time (s) and pace per 500 m arrays from raw columns."""
+    distance_m = np.array(distances, dtype=np.int64)
+    time_seconds = np.array(times, dtype=np.float64) / 10.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pace = np.where(distance_m > 0, time_seconds / distance_m * 500, np.nan)
+    return distance_m, time_seconds, pace
+
+
+def iter_export_rows(batch_size: int = 5000) -> Iterator[list[tuple]]:
+    """Yield the CSV export header, then row batches of ``batch_size``.
+
+    Columns match the analytics DataFrame so existing notebooks read the
+    file unchanged.  Runs on its own connection because a streaming
+    response may resume the generator on a different worker thread.
+    """
+    conn = _open_connection(DB_PATH)
+    try:
+        cur = conn.execute(_EXPORT_SQL)
+        yield [[d[0] for d in cur.description]]
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+    finally:
+        conn.close()
+
+
 # ──────────────────────────────────────────────
 # Sync logic
 # ──────────────────────────────────────────────
+def current_sync_info() -> Optional[dict]:
+    """Return the :func:`sync_workouts` no-op result, or None if a sync is due.
+
+    Synchronous and a single read, so callers can skip building an API
+    client altogether on the common path.
+    """
+    # One read answers "is a sync due?" and fills the no-op response
+    row = _get_connection().execute(
+        "SELECT last_sync_unix, total_rows FROM sync_meta WHERE id = 1"
+    ).fetchone()
+    if not row or row[0] is None or time.time() - row[0] >= SYNC_INTERVAL.total_seconds():
+        return None
+    last = datetime.fromtimestamp(row[0], tz=timezone.utc)
+    total = row[1]
+    logger.info(
+        f"Sync not needed — last sync {last.isoformat()} "
+        f"({total} workouts in DB)"
+    )
+    return {
+        "synced": False,
+        "new_workouts": 0,
+        "total_workouts": total,
+        "last_sync": last.isoformat(),
+    }
+
+
 async def sync_workouts(client: Concept2Client) -> dict:
     """Perform an incremental sync from the Concept2 API to SQLite.
 
@@ -281,21 +885,12 @@ async def sync_workouts(client: Concept2Client) -> dict:
         - ``total_workouts``: int — total workouts in the DB
         - ``last_sync``: str — ISO timestamp of last sync
     """
-    init_db()
-
-    if not needs_sync():
-        last = get_last_sync()
-        total = get_workout_count()
-        logger.info(
-            f"Sync not needed — last sync {last.isoformat()} "
-            f"({total} workouts in DB)"
-        )
-        return {
-            "synced": False,
-            "new_workouts": 0,
-            "total_workouts": total,
-            "last_sync": last.isoformat() if last else None,
-        }
+    if str(DB_PATH) not in _initialized:
+        init_db()
+
+    fresh = current_sync_info()
+    if fresh is not None:
+        return fresh
 
     # Determine what to fetch
     latest_date = get_latest_workout_date()
@@ -303,24 +898,30 @@ async def sync_workouts(client: Concept2Client) -> dict:
     if latest_date is None:
         # First sync — full historical fetch
         logger.info("First sync: fetching full workout history…")
-        results = await client.get_all_results(workout_type="rower")
+        pages = client.iter_results(workout_type="rower")
     else:
         # Incremental: fetch from the day after the latest workout
         # We use the latest date (not latest+1day) to catch any late updates
         logger.info(f"Incremental sync: fetching workouts from {latest_date}…")
-        results = await client.get_all_results(
+        pages = client.iter_results(
             from_date=latest_date,
             workout_type="rower",
         )
 
-    # Write to DB
-    conn = _get_connection()
-    new_count = _upsert_workouts(conn, results)
-    _update_sync_meta(conn)
-    conn.commit()
-    total = conn.execute("SELECT COUNT(*) FROM workouts").fetchone()[0]
-    conn.close()
-
+    # Each page is written in its own short transaction on a worker thread
+    # while iter_results keeps fetching the next pages, so the write lock
+    # is never held across a network round-trip.  The sync time is stamped
+    # only once every page is in.
+    new_count = 0
+    try:
+        async for page in pages:
+            new_count += await asyncio.to_thread(_store_page, page)
+    except BaseException:
+        await asyncio.to_thread(_rewind_sync, latest_date)
+        raise
+    await asyncio.to_thread(_finish_sync, new_count)
+
+    total = get_workout_count()
     last_sync = get_last_sync()
     logger.info(
         f"Sync complete: {new_count} workouts written, "
@@ -2,47 +2,150 @@
 
 from __future__ import annotations
 
+import asyncio
+import csv
+import gzip
+import hashlib
+import io
 import os
 import secrets
+import time
 import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import date
+from functools import lru_cache
 from typing import Optional
 
+import jinja2
+import numpy as np
+import orjson
+import pandas as pd
+import plotly
 import plotly.express as px
+import plotly.graph_objects as go
 import plotly.io as pio
+from plotly.offline import get_plotlyjs
+from plotly.subplots import make_subplots
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import (
+    HTMLResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from loguru import logger
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from .analytics import (
     compute_summary,
-    monthly_volume,
+    days_since,
+    lttb_indices,
+    pace_ticks,
     pace_trend_regression,
     personal_bests,
-    results_to_dataframe,
     training_heatmap_data,
-    weekly_volume,
     workout_clustering,
 )
-from .api_client import Concept2Client
-from .auth import exchange_code_for_token, get_authorization_url, refresh_access_token
+from .api_client import Concept2Client, create_http_client
+from .auth import (
+    close_http_client,
+    exchange_code_for_token,
+    get_authorization_url,
+    open_http_client,
+    refresh_access_token,
+)
 from .config import settings
-from .database import init_db, load_workouts_as_models, sync_workouts, get_last_sync, get_workout_count, needs_sync
+from .database import (
+    current_sync_info,
+    init_db,
+    iter_export_rows,
+    iter_workout_dicts,
+    load_workouts_as_frame,
+    load_monthly_volume,
+    load_weekly_volume,
+    sync_workouts,
+    get_data_version,
+    get_workout_count,
+    store_workouts,
+)
+from .models import WorkoutResult
 
 # ──────────────────────────────────────────────
 # App setup
 # ──────────────────────────────────────────────
-app = FastAPI(title="Concept2 Rowing Analytics", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialise the database, templates and shared API client; release them on exit."""
+    init_db()
+    templates.get_template("dashboard.html")  # compile before the first request
+    # One connection pool to the Concept2 API for every request, and one
+    # to the OAuth token endpoint
+    app.state.http = create_http_client()
+    open_http_client()
+    # Build the default dashboard in the background; a request that
+    # arrives first joins that build instead of starting its own
+    warm = asyncio.create_task(_warm_dashboard_cache())
+    yield
+    warm.cancel()
+    await app.state.http.aclose()
+    await close_http_client()
+    _chart_pool.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(
+    title="Concept2 Rowing Analytics",
+    version="0.1.0",
+    lifespan=lifespan,
+)
 app.add_middleware(SessionMiddleware, secret_key=settings.app_secret_key)
+# Figure JSON and plotly.js compress several-fold; level 5 keeps CPU low
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 app.mount("/static", StaticFiles(directory="rowing_app/static"), name="static")
-templates = Jinja2Templates(directory="rowing_app/templates")
+# Outside debug, templates are compiled once and never re-stat'ed; the
+# bytecode cache (per-user temp dir) spares restarts the compile as well
+templates = Jinja2Templates(env=jinja2.Environment(
+    loader=jinja2.FileSystemLoader("rowing_app/templates"),
+    autoescape=True,
+    auto_reload=settings.app_debug,
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
+))
 
 # Auto cache-bust: use CSS file mtime as version query param
 _css_path = os.path.join("rowing_app", "static", "style.css")
 _css_version = str(int(os.path.getmtime(_css_path))) if os.path.exists(_css_path) else "1"
 
+# Month abbreviations indexed by month number (1–12) for axis labels
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+              "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Rendered dashboard pages by ETag, oldest first
+_page_cache: dict[str, bytes] = {}
+_PAGE_CACHE_SIZE = 16
+
+# Dashboard payload builds in progress, keyed like _dashboard_payload
+_payload_inflight: dict[tuple, asyncio.Future] = {}
+
+# Worker threads for building dashboard analytics and figures in parallel
+_chart_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="charts")
+
+# Seconds a verified access token is trusted before re-checking it
+TOKEN_CHECK_TTL = 600
+
+# Marker traces longer than this are LTTB-downsampled before serialising
+MAX_SCATTER_POINTS = 1500
+
+# plotly.js bundled with the installed plotly package, so the browser always
+# runs the version the server-side figure JSON was written for
+_plotly_js = get_plotlyjs().encode()
+# Encoded and compressed once here rather than by GZipMiddleware per request
+_plotly_js_gz = gzip.compress(_plotly_js, compresslevel=9, mtime=0)
+_plotly_version = plotly.__version__
+
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -55,12 +158,6 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialise the local SQLite database on app start."""
-    init_db()
-
-
 # ──────────────────────────────────────────────
 # Debug endpoint – renders full dashboard with local data, no auth
 # ──────────────────────────────────────────────
@@ -68,8 +165,6 @@ async def startup_event():
 async def debug_dashboard(request: Request):
     """Full dashboard render using cached DB data – no OAuth required."""
     try:
-        results = load_workouts_as_models()
-
         # Create a fake response object that mimics the Concept2 user API response
         class _FakeResp:
             class data:
@@ -77,7 +172,7 @@ async def debug_dashboard(request: Request):
                 username = "eduardo"
         fake_resp = _FakeResp()
 
-        return await _build_dashboard(request, fake_resp, results, None, None, None, is_authenticated=False)
+        return await _build_dashboard(request, fake_resp, None, None, None, is_authenticated=False)
     except Exception as e:
         tb = traceback.format_exc()
         logger.error(f"Debug dashboard error:\n{tb}")
@@ -130,6 +225,18 @@ async def logout(request: Request):
 # ──────────────────────────────────────────────
 # Dashboard
 # ──────────────────────────────────────────────
+# Access tokens that passed get_user(), with the monotonic time they did
+_verified_tokens: dict[str, float] = {}
+
+
+def _token_recently_verified(token: str) -> bool:
+    """True if ``token`` passed a get_user() check within TOKEN_CHECK_TTL."""
+    now = time.monotonic()
+    for stale in [t for t, at in _verified_tokens.items() if now - at >= TOKEN_CHECK_TTL]:
+        del _verified_tokens[stale]
+    return token in _verified_tokens
+
+
 @app.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(
     request: Request,
@@ -143,24 +250,28 @@ async def dashboard(
 
     if token:
         # Authenticated user: try to sync and get live profile
-        client = Concept2Client(access_token=token)
-        try:
-            await client.get_user()  # verify token is still valid
-            sync_info = await sync_workouts(client)
-            is_authenticated = True
-        except Exception as e:
-            logger.warning(f"Auth session expired, showing public dashboard: {e}")
-            # Try refreshing the token
-            refresh = request.session.get("refresh_token")
-            if refresh:
-                try:
-                    new_token = await refresh_access_token(refresh)
-                    request.session["access_token"] = new_token.access_token
-                    request.session["refresh_token"] = new_token.refresh_token
-                    return RedirectResponse("/dashboard")
-                except Exception:
-                    pass
-            request.session.clear()
+        async with Concept2Client(access_token=token, client=request.app.state.http) as client:
+            try:
+                sync_info = await _verify_and_sync(client)
+                is_authenticated = True
+            except Exception as e:
+                sync_info = None
+                # Try refreshing the token, then retry on the same client
+                # instead of redirecting through a second page load
+                refresh = request.session.get("refresh_token")
+                if refresh:
+                    try:
+                        new_token = await refresh_access_token(refresh)
+                        request.session["access_token"] = new_token.access_token
+                        request.session["refresh_token"] = new_token.refresh_token
+                        client.set_access_token(new_token.access_token)
+                        sync_info = await _verify_and_sync(client)
+                        is_authenticated = True
+                    except Exception:
+                        pass
+                if not is_authenticated:
+                    logger.warning(f"Auth session expired, showing public dashboard: {e}")
+                    request.session.clear()
 
     # Always show dashboard from local DB (works for everyone)
     class _FakeResp:
@@ -169,14 +280,9 @@ async def dashboard(
             username = "eduardo"
     fake_resp = _FakeResp()
 
-    results = load_workouts_as_models(
-        from_date=from_date,
-        to_date=to_date,
-    )
-
     try:
         return await _build_dashboard(
-            request, fake_resp, results, sync_info, from_date, to_date,
+            request, fake_resp, sync_info, from_date, to_date,
             is_authenticated=is_authenticated,
         )
     except Exception as e:
@@ -188,351 +294,568 @@ async def dashboard(
         )
 
 
-async def _build_dashboard(request, user_resp, results, sync_info, from_date, to_date, is_authenticated=False):
-    """Build the full dashboard (extracted for error isolation)."""
-    df = results_to_dataframe(results)
-    summary = compute_summary(df)
-    pbs = personal_bests(df)
-    monthly = monthly_volume(df)
-    weekly = weekly_volume(df)
-    heatmap = training_heatmap_data(df)
-    regression = pace_trend_regression(df)
-    clustering = workout_clustering(df, n_clusters=4)
+async def _verify_and_sync(client: Concept2Client) -> Optional[dict]:
+    """Check the client's token and sync if due; return the page's sync info.
 
-    # Build Plotly charts (as HTML snippets)
-    charts = {}
-    if not monthly.empty:
-        fig_monthly = px.bar(
-            monthly,
-            x="month",
-            y="total_distance_km",
-            title="Monthly Distance (km)",
-            labels={"month": "Month", "total_distance_km": "Distance (km)"},
-        )
-        fig_monthly.update_layout(template="plotly_white")
-        charts["monthly_distance"] = pio.to_html(fig_monthly, full_html=False)
-
-    if not weekly.empty:
-        fig_weekly = px.bar(
-            weekly,
-            x="year_week",
-            y="total_distance_km",
-            title="Weekly Distance (km)",
-            labels={"year_week": "Week", "total_distance_km": "Distance (km)"},
-        )
-        fig_weekly.update_layout(template="plotly_white")
-        charts["weekly_distance"] = pio.to_html(fig_weekly, full_html=False)
-
-    # ── Training Heatmap (GitHub-style) ───────────
-    if heatmap:
-        import plotly.graph_objects as go
-        import numpy as np
-        z_raw = heatmap["z_values"]
-        date_raw = heatmap["date_labels"]
-        # Transpose: GitHub has weeks on X-axis, weekdays on Y-axis
-        z_t = np.array(z_raw).T.tolist()  # shape: 7 days × N weeks
-        date_t = np.array(date_raw).T.tolist()  # matching shape
-        weeks = heatmap["weeks"]
-        days = heatmap["days"]  # ["Mon", "Tue", ..., "Sun"]
-        # Reverse days so Mon is at the top (GitHub style)
-        z_t = z_t[::-1]
-        date_t = date_t[::-1]
-        days_reversed = days[::-1]
-        num_weeks = len(weeks)
-
-        fig_heat = go.Figure(data=go.Heatmap(
-            z=z_t,
-            x=weeks,            # X-axis: weeks (many columns)
-            y=days_reversed,    # Y-axis: Mon–Sun (7 rows)
-            customdata=date_t,
-            colorscale=[
-                [0.0, "#ebedf0"], [0.001, "#9be9a8"],
-                [0.25, "#40c463"], [0.5, "#30a14e"], [1.0, "#216e39"],
-            ],
-            hovertemplate="Date: %{customdata}<br>Distance: %{z:,.0f}m<extra></extra>",
-            colorbar=dict(title="Meters", thickness=10, len=0.5),
-            xgap=4,
-            ygap=4,
-        ))
-        # Build month labels: show "Jan", "Feb", … at the first week of each month
-        import re
-        month_map = {
-            "01": "Jan", "02": "Feb", "03": "Mar", "04": "Apr",
-            "05": "May", "06": "Jun", "07": "Jul", "08": "Aug",
-            "09": "Sep", "10": "Oct", "11": "Nov", "12": "Dec",
-        }
-        tick_vals, tick_text = [], []
-        seen_months = set()
-        for w in weeks:
-            m = re.search(r"(\d{4})-W(\d{2})", w)
-            if m:
-                yr, wk = int(m.group(1)), int(m.group(2))
-                # approximate month from ISO week
-                from datetime import date
-                try:
-                    d = date.fromisocalendar(yr, wk, 1)
-                    key = f"{d.year}-{d.month:02d}"
-                    if key not in seen_months:
-                        seen_months.add(key)
-                        tick_vals.append(w)
-                        tick_text.append(f"{month_map[f'{d.month:02d}']} {d.year}")
-                except Exception:
-                    pass
-
-        fig_heat.update_layout(
-            title=dict(text="Training Heatmap — Distance per Day", y=0.98,
-                       font=dict(size=14)),
-            xaxis=dict(
-                side="top", tickangle=0,
-                tickfont=dict(size=10),
-                tickvals=tick_vals,
-                ticktext=tick_text,
-            ),
-            yaxis=dict(tickfont=dict(size=11), automargin=True),
-            width=max(600, num_weeks * 20 + 140),
-            height=240,
-            template="plotly_white",
-            margin=dict(l=50, r=80, t=70, b=10),
-            plot_bgcolor="#fff",
-        )
-        charts["heatmap"] = pio.to_html(fig_heat, full_html=False)
-
-    # ── Pace Trend Regression ─────────────────────
-    if regression:
-        import plotly.graph_objects as go
-        # Build gradient colorscale: green (faster) → gold → red (slower)
-        paces_arr = regression["paces"]
-        pace_min = min(paces_arr)
-        pace_max = max(paces_arr)
-        pace_range = pace_max - pace_min if pace_max > pace_min else 1
-        green_threshold = min(max((160 - pace_min) / pace_range, 0), 1)
-        yellow_threshold = min(green_threshold + 0.1, 1)
-        colorscale = [
-            [0, "green"],
-            [green_threshold, "green"],
-            [yellow_threshold, "gold"],
-            [1, "red"],
-        ]
-        fig_reg = go.Figure()
-        # Trace 0: Actual Pace (gradient-colored dots)
-        fig_reg.add_trace(go.Scatter(
-            x=regression["dates"], y=regression["paces"],
-            mode="markers", name="Actual Pace",
-            marker=dict(
-                size=8,
-                color=paces_arr,
-                colorscale=colorscale,
-                cmin=pace_min,
-                cmax=pace_max,
-                showscale=False,
-            ),
-            hovertemplate="Date: %{x}<br>Pace: %{text}<extra></extra>",
-            text=regression["pace_formatted"],
-        ))
-        # Trace 1 (invisible legend ref): Faster
-        fig_reg.add_trace(go.Scatter(
-            x=[None], y=[None], mode="markers",
-            marker=dict(size=10, color="green"),
-            name="Faster",
-        ))
-        # Trace 2 (invisible legend ref): Slower
-        fig_reg.add_trace(go.Scatter(
-            x=[None], y=[None], mode="markers",
-            marker=dict(size=10, color="red"),
-            name="Slower",
-        ))
-        # Trace 3: Linear
-        fig_reg.add_trace(go.Scatter(
-            x=regression["dates"], y=regression["trend_y"],
-            mode="lines", name=f"Linear (R\u00b2={regression['r_squared']:.2f})",
-            line=dict(color="red", width=2, dash="dash"),
-        ))
-        # Trace 4: Polynomial
-        fig_reg.add_trace(go.Scatter(
-            x=regression["dates"], y=regression["poly_y"],
-            mode="lines", name=f"Polynomial deg {regression['poly_degree']} (R\u00b2={regression['poly_r_squared']:.2f})",
-            line=dict(color="#9C27B0", width=2.5),
-        ))
-        # Trace 5: Rolling Avg
-        fig_reg.add_trace(go.Scatter(
-            x=regression["dates"], y=regression["rolling_avg"],
-            mode="lines", name="10-workout Rolling Avg",
-            line=dict(color="#03A9F4", width=2),
-        ))
-        # M:SS y-axis
-        all_paces = [p for p in regression["paces"] if p is not None]
-        rmin = (int(min(all_paces)) // 5) * 5
-        rmax = ((int(max(all_paces)) // 5) + 1) * 5
-        rtickv = list(range(rmin, rmax + 1, 5))
-        rtickt = [f"{v // 60}:{v % 60:02d}" for v in rtickv]
-        direction = "Getting Faster" if regression["improving"] else "Getting Slower"
-        fig_reg.add_annotation(
-            x=0.02, y=0.98, xref="paper", yref="paper",
-            text=f"<b>Rate:</b> {abs(regression['pace_change_per_month']):.1f}s /500m per month<br><b>{direction}</b>",
-            showarrow=False, bgcolor="rgba(255,255,255,0.8)", bordercolor="#ccc",
-            font=dict(size=12), align="left",
-        )
-        fig_reg.update_layout(
-            title="Pace Trend \u2014 Linear & Polynomial Regression",
-            xaxis_title="Date", yaxis_title="Pace /500m",
-            yaxis=dict(tickvals=rtickv, ticktext=rtickt),
-            template="plotly_white", height=500,
-            legend=dict(x=0.02, y=0.02, bgcolor="rgba(255,255,255,0.8)"),
-        )
-        charts["regression"] = pio.to_html(fig_reg, full_html=False)
-
-    # ── Workout Clustering ────────────────────────
-    if clustering:
-        import plotly.graph_objects as go
-        from plotly.subplots import make_subplots
-        # Fixed colors mapped to labels (left→right = Sprint → Endurance)
-        label_colors = {
-            "Sprint": "#FFC107",
-            "5K Steady-State": "#2196F3",
-            "Mid-Distance (5-10K)": "#9C27B0",
-            "10K Steady-State": "#FF5722",
-            "Endurance 10K+": "#4CAF50",
-        }
-        # Variant shades for "(High Intensity)" suffixed labels
-        label_colors_hi = {
-            "Sprint": "#FFD54F",
-            "5K Steady-State": "#64B5F6",
-            "Mid-Distance (5-10K)": "#BA68C8",
-            "10K Steady-State": "#FF8A65",
-            "Endurance 10K+": "#81C784",
-        }
-        def _get_color(label, idx):
-            if label in label_colors:
-                return label_colors[label]
-            # Check for "(High Intensity)" variant
-            base = label.replace(" (High Intensity)", "")
-            if base in label_colors_hi:
-                return label_colors_hi[base]
-            return ["#00BCD4", "#E91E63", "#795548", "#607D8B"][idx % 4]
-
-        # Cluster scatter (Distance vs Pace)
-        fig_cl = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=["Distance vs Pace", "Distance vs Duration",
-                            "Distance vs Stroke Rate", "Distance vs Calories"],
-            horizontal_spacing=0.12, vertical_spacing=0.12,
-        )
-        # Profiles are already sorted by distance in analytics.py
-        for i, profile in enumerate(clustering["cluster_profiles"]):
-            cid = profile["id"]
-            pts = [p for p in clustering["scatter_data"] if p["cluster"] == cid]
-            color = _get_color(profile["label"], i)
-            dists = [p["distance"] for p in pts]
-            paces = [p["pace"] for p in pts]
-            tmins = [p["time_min"] for p in pts]
-            spms = [p["stroke_rate"] for p in pts if p["stroke_rate"] is not None]
-            cals = [p["calories"] for p in pts if p["calories"] is not None]
-            dists_spm = [p["distance"] for p in pts if p["stroke_rate"] is not None]
-            dists_cal = [p["distance"] for p in pts if p["calories"] is not None]
-            show_legend = True
-            fig_cl.add_trace(go.Scatter(
-                x=dists, y=paces, mode="markers",
-                name=profile["label"],
-                marker=dict(size=8, color=color, opacity=0.7),
-                legendgroup=f"c{cid}", showlegend=show_legend,
-            ), row=1, col=1)
-            fig_cl.add_trace(go.Scatter(
-                x=dists, y=tmins, mode="markers",
-                name=profile["label"],
-                marker=dict(size=8, color=color, opacity=0.7),
-                legendgroup=f"c{cid}", showlegend=False,
-            ), row=1, col=2)
-            if spms:
-                fig_cl.add_trace(go.Scatter(
-                    x=dists_spm, y=spms, mode="markers",
-                    name=profile["label"],
-                    marker=dict(size=8, color=color, opacity=0.7),
-                    legendgroup=f"c{cid}", showlegend=False,
-                ), row=2, col=1)
-            if cals:
-                fig_cl.add_trace(go.Scatter(
-                    x=dists_cal, y=cals, mode="markers",
-                    name=profile["label"],
-                    marker=dict(size=8, color=color, opacity=0.7),
-                    legendgroup=f"c{cid}", showlegend=False,
-                ), row=2, col=2)
-        # M:SS on top-left y-axis
-        all_cl_paces = [p["pace"] for p in clustering["scatter_data"]]
-        cmin = (int(min(all_cl_paces)) // 5) * 5
-        cmax = ((int(max(all_cl_paces)) // 5) + 1) * 5
-        ctickv = list(range(cmin, cmax + 1, 10))
-        ctickt = [f"{v // 60}:{v % 60:02d}" for v in ctickv]
-        fig_cl.update_xaxes(title_text="Distance (m)", row=1, col=1)
-        fig_cl.update_xaxes(title_text="Distance (m)", row=1, col=2)
-        fig_cl.update_xaxes(title_text="Distance (m)", row=2, col=1)
-        fig_cl.update_xaxes(title_text="Distance (m)", row=2, col=2)
-        fig_cl.update_yaxes(title_text="Pace /500m", tickvals=ctickv, ticktext=ctickt, row=1, col=1)
-        fig_cl.update_yaxes(title_text="Duration (min)", row=1, col=2)
-        fig_cl.update_yaxes(title_text="Stroke Rate (spm)", row=2, col=1)
-        fig_cl.update_yaxes(title_text="Calories (cal)", row=2, col=2)
-        fig_cl.update_layout(
-            title="Workout Clusters — K-Means",
-            template="plotly_white", height=900, width=1000,
+    Raises if the token is rejected.  A failed sync only logs and yields
+    None, since it says nothing about the token.
+    """
+    sync_info = current_sync_info()
+    token = client.access_token
+    # Only talk to the API when a sync is due or the token hasn't been
+    # checked recently
+    if sync_info is not None and _token_recently_verified(token):
+        return sync_info
+    if sync_info is None:
+        # Token check and sync are independent round-trips
+        user_res, sync_res = await asyncio.gather(
+            client.get_user(), sync_workouts(client),
+            return_exceptions=True,
         )
-        charts["clustering"] = pio.to_html(fig_cl, full_html=False)
-
-        # Pie chart for training balance (uses distance-based categories)
-        cat_profiles = clustering.get("category_profiles", clustering["cluster_profiles"])
-        labels = [p["label"] for p in cat_profiles]
-        counts = [p["count"] for p in cat_profiles]
-        colors_pie = [_get_color(p["label"], i) for i, p in enumerate(cat_profiles)]
-        fig_pie = go.Figure(data=[go.Pie(
-            labels=labels, values=counts,
-            marker=dict(colors=colors_pie),
-            textinfo="label+percent",
-        )])
-        fig_pie.update_layout(title="Training Balance", template="plotly_white")
-        charts["cluster_pie"] = pio.to_html(fig_pie, full_html=False)
-
-    return templates.TemplateResponse(
+        if isinstance(sync_res, BaseException):
+            logger.warning(f"Sync failed: {sync_res}")
+        else:
+            sync_info = sync_res
+        if isinstance(user_res, BaseException):
+            raise user_res
+    else:
+        await client.get_user()  # verify token is still valid
+    _verified_tokens[token] = time.monotonic()
+    return sync_info
+
+
+async def _build_dashboard(request, user_resp, sync_info, from_date, to_date, is_authenticated=False):
+    """Build the full dashboard (extracted for error isolation).
+
+    The page is a pure function of the data version, today's date (for
+    days_since_last) and the values below, so it is tagged with an ETag:
+    a matching ``If-None-Match`` gets a 304, and recently rendered pages
+    are served without touching Jinja.
+    """
+    data_version = get_data_version()
+    etag = _dashboard_etag((
+        data_version, date.today().isoformat(), from_date or "", to_date or "",
+        user_resp.data.first_name, user_resp.data.username,
+        tuple(sorted(sync_info.items())) if sync_info else None,
+        is_authenticated, _css_version, _plotly_version,
+    ))
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag in (t.strip() for t in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers=headers)
+    if etag in _page_cache:
+        return HTMLResponse(_page_cache[etag], headers=headers)
+
+    payload = await _shared_dashboard_payload(
+        from_date or None, to_date or None, data_version
+    )
+    response = templates.TemplateResponse(
+        request,
         "dashboard.html",
         {
-            "request": request,
             "user": user_resp.data,
-            "summary": summary,
-            "personal_bests": pbs,
-            "charts": charts,
-            "clustering": clustering,
-            "regression": regression,
+            **payload,
+            "summary": _current_summary(payload["summary"]),
             "from_date": from_date or "",
             "to_date": to_date or "",
             "sync_info": sync_info,
             "is_authenticated": is_authenticated,
             "css_version": _css_version,
+            "plotly_version": _plotly_version,
         },
+        headers=headers,
     )
+    _page_cache[etag] = response.body
+    while len(_page_cache) > _PAGE_CACHE_SIZE:
+        del _page_cache[next(iter(_page_cache))]
+    return response
+
+
+async def _warm_dashboard_cache() -> None:
+    """Prime the payload cache for the unfiltered dashboard."""
+    if not get_workout_count():
+        return
+    try:
+        await _shared_dashboard_payload(None, None, get_data_version())
+    except Exception as e:
+        logger.warning(f"Dashboard cache warm-up failed: {e}")
+    else:
+        logger.info("Dashboard cache warmed.")
+
+
+async def _shared_dashboard_payload(from_date, to_date, data_version) -> dict:
+    """Build (or join the in-progress build of) a dashboard payload.
+
+    Runs off the event loop, since a cache miss is seconds of
+    pandas/sklearn/plotly.  Concurrent requests for the same key await a
+    single build instead of each starting one before the lru_cache fills.
+    """
+    key = (from_date, to_date, data_version)
+    future = _payload_inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(asyncio.to_thread(_dashboard_payload, *key))
+        _payload_inflight[key] = future
+        future.add_done_callback(lambda _: _payload_inflight.pop(key, None))
+    # A disconnecting client must not cancel the build for the others
+    return await asyncio.shield(future)
+
+
+def _current_summary(summary: dict) -> dict:
+    """Copy of a cached summary with ``days_since_last`` counted to today.
+
+    The cached payloads live until the data changes, which can be days;
+    the one date-relative field is recomputed on every use.
+    """
+    if "last_workout" not in summary:
+        return summary
+    return {**summary, "days_since_last": days_since(summary["last_workout"])}
+
+
+def _dashboard_etag(key: tuple) -> str:
+    """Strong ETag for a dashboard render identified by ``key``."""
+    return '"' + hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest() + '"'
+
+
+@app.get("/js/plotly.min.js")
+async def plotly_js(request: Request):
+    """Serve plotly.js once per browser; the URL is versioned, so cache forever."""
+    headers = {"Cache-Control": "public, max-age=31536000, immutable", "Vary": "Accept-Encoding"}
+    body = _plotly_js
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        body = _plotly_js_gz
+    return Response(body, media_type="application/javascript", headers=headers)
+
+
+@lru_cache(maxsize=8)
+def _workouts_frame(from_date: Optional[str], to_date: Optional[str], data_version: tuple) -> pd.DataFrame:
+    """Workout frame for one date range, cached on the data version.
+
+    Loaded once for the dashboard payload and ``/api/summary`` alike.
+    The returned frame is shared: read-only.
+    """
+    return load_workouts_as_frame(from_date=from_date, to_date=to_date)
+
+
+@lru_cache(maxsize=32)
+def _summary_payload(from_date: Optional[str], to_date: Optional[str], data_version: tuple) -> dict:
+    """Summary statistics for one date range, cached like the dashboard.
+
+    Shared by the dashboard and ``/api/summary``, so whichever runs first
+    for a range and data version leaves the other a dict lookup.  Pass
+    the result through ``_current_summary`` before serving it.
+    """
+    return compute_summary(_workouts_frame(from_date, to_date, data_version))
+
+
+@lru_cache(maxsize=32)
+def _dashboard_payload(from_date: Optional[str], to_date: Optional[str], data_version: tuple) -> dict:
+    """Analytics and serialized charts for one date range.
+
+    Cached on ``data_version`` (bumped by every sync), so reloads between
+    syncs skip the pandas/plotly work entirely.  Request-specific context
+    stays outside the cache.  The returned dict is shared: read-only.
+    """
+    df = _workouts_frame(from_date, to_date, data_version)
+    summary = _summary_payload(from_date, to_date, data_version)
+    pbs = personal_bests(df)
+    # Grouped in SQLite (full history straight from the aggregate tables)
+    monthly = load_monthly_volume(from_date, to_date)
+    weekly = load_weekly_volume(from_date, to_date)
+    # The heavier analytics are independent too: overlap them on the pool
+    heatmap_f = _chart_pool.submit(training_heatmap_data, df)
+    regression_f = _chart_pool.submit(pace_trend_regression, df)
+    clustering_f = _chart_pool.submit(workout_clustering, df, n_clusters=4)
+    heatmap = heatmap_f.result()
+    regression = regression_f.result()
+    clustering = clustering_f.result()
+
+    # Build Plotly charts (as figure JSON, drawn client-side by Plotly.react).
+    # Each builder is independent pandas/plotly work, so they run side by
+    # side on the chart pool; merging in a fixed order keeps output stable.
+    builders = [
+        (_monthly_chart, monthly, not monthly.empty),
+        (_weekly_chart, weekly, not weekly.empty),
+        (_heatmap_chart, heatmap, bool(heatmap)),
+        (_regression_chart, regression, bool(regression)),
+        (_clustering_chart, clustering, bool(clustering)),
+    ]
+    futures = [_chart_pool.submit(build, data) for build, data, wanted in builders if wanted]
+    charts = {}
+    for future in futures:
+        charts.update(future.result())
+
+    return {
+        "summary": summary,
+        "personal_bests": pbs,
+        "charts": charts,
+        "clustering": clustering,
+        "regression": regression,
+    }
+
+
+# ──────────────────────────────────────────────
+# Chart builders (each returns {chart name: figure JSON})
+# ──────────────────────────────────────────────
+def _monthly_chart(monthly: pd.DataFrame) -> dict[str, str]:
+    """Monthly distance bar chart."""
+    charts = {}
+    fig_monthly = px.bar(
+        monthly,
+        x="month",
+        y="total_distance_km",
+        title="Monthly Distance (km)",
+        labels={"month": "Month", "total_distance_km": "Distance (km)"},
+    )
+    fig_monthly.update_layout(template="plotly_white")
+    charts["monthly_distance"] = pio.to_json(fig_monthly, validate=False)
+    return charts
+
+
+def _weekly_chart(weekly: pd.DataFrame) -> dict[str, str]:
+    """Weekly distance bar chart."""
+    charts = {}
+    fig_weekly = px.bar(
+        weekly,
+        x="year_week",
+        y="total_distance_km",
+        title="Weekly Distance (km)",
+        labels={"year_week": "Week", "total_distance_km": "Distance (km)"},
+    )
+    fig_weekly.update_layout(template="plotly_white")
+    charts["weekly_distance"] = pio.to_json(fig_weekly, validate=False)
+    return charts
+
+
+def _heatmap_chart(heatmap: dict) -> dict[str, str]:
+    """GitHub-style training heatmap."""
+    charts = {}
+    # Transpose: GitHub has weeks on X-axis, weekdays on Y-axis, then
+    # flip the rows so Mon is at the top (GitHub style).  Whole metres
+    # as int32 let plotly ship z as a compact typed array.
+    z_t = np.flipud(np.asarray(heatmap["z_values"]).T).astype(np.int32)  # 7 days × N weeks
+    date_t = np.flipud(np.asarray(heatmap["date_labels"]).T)  # matching shape
+    weeks = heatmap["weeks"]
+    days = heatmap["days"]  # ["Mon", "Tue", ..., "Sun"]
+    days_reversed = days[::-1]
+    num_weeks = len(weeks)
+
+    fig_heat = go.Figure(data=go.Heatmap(
+        z=z_t,
+        x=weeks,            # X-axis: weeks (many columns)
+        y=days_reversed,    # Y-axis: Mon–Sun (7 rows)
+        customdata=date_t,
+        colorscale=[
+            [0.0, "#ebedf0"], [0.001, "#9be9a8"],
+            [0.25, "#40c463"], [0.5, "#30a14e"], [1.0, "#216e39"],
+        ],
+        hovertemplate="Date: %{customdata}<br>Distance: %{z:,.0f}m<extra></extra>",
+        colorbar=dict(title="Meters", thickness=10, len=0.5),
+        xgap=4,
+        ygap=4,
+    ))
+    # Build month labels: show "Jan", "Feb", … at the first week of each month
+    week_index = pd.Index(weeks)
+    mondays = pd.to_datetime(week_index + "-1", format="%G-W%V-%u")
+    first_of_month = ~(mondays.year * 12 + mondays.month).duplicated()
+    tick_vals = week_index[first_of_month].tolist()
+    tick_text = [
+        f"{_MONTH_ABBR[m]} {y}"
+        for y, m in zip(mondays.year[first_of_month], mondays.month[first_of_month])
+    ]
+
+    fig_heat.update_layout(
+        title=dict(text="Training Heatmap — Distance per Day", y=0.98,
+                   font=dict(size=14)),
+        xaxis=dict(
+            side="top", tickangle=0,
+            tickfont=dict(size=10),
+            tickvals=tick_vals,
+            ticktext=tick_text,
+        ),
+        yaxis=dict(tickfont=dict(size=11), automargin=True),
+        width=max(600, num_weeks * 20 + 140),
+        height=240,
+        template="plotly_white",
+        margin=dict(l=50, r=80, t=70, b=10),
+        plot_bgcolor="#fff",
+    )
+    charts["heatmap"] = pio.to_json(fig_heat, validate=False)
+    return charts
+
+
+def _regression_chart(regression: dict) -> dict[str, str]:
+    """Pace trend scatter with the fitted lines."""
+    charts = {}
+    # Build gradient colorscale: green (faster) → gold → red (slower)
+    pace_np = regression["paces"]
+    pace_min = float(pace_np.min())
+    pace_max = float(pace_np.max())
+    pace_range = pace_max - pace_min if pace_max > pace_min else 1
+    green_threshold = min(max((160 - pace_min) / pace_range, 0), 1)
+    yellow_threshold = min(green_threshold + 0.1, 1)
+    colorscale = [
+        [0, "green"],
+        [green_threshold, "green"],
+        [yellow_threshold, "gold"],
+        [1, "red"],
+    ]
+    # Thin the markers on long histories; colour bounds, ticks and the
+    # fitted lines still use every workout
+    dates_arr = regression["dates"]
+    pace_text = regression["pace_formatted"]
+    paces_arr = pace_np
+    if len(pace_np) > MAX_SCATTER_POINTS:
+        days = np.asarray(dates_arr, dtype="datetime64[D]").astype(np.int64)
+        keep = lttb_indices(days, pace_np, MAX_SCATTER_POINTS)
+        dates_arr = np.asarray(dates_arr)[keep]
+        paces_arr = pace_np[keep]
+        pace_text = np.asarray(pace_text)[keep]
+    # float32 ndarrays serialise as compact base64 typed arrays
+    paces_arr = paces_arr.astype(np.float32)
+    fig_reg = go.Figure()
+    # Trace 0: Actual Pace (gradient-colored dots)
+    fig_reg.add_trace(go.Scatter(
+        x=dates_arr, y=paces_arr,
+        mode="markers", name="Actual Pace",
+        marker=dict(
+            size=8,
+            color=paces_arr,
+            colorscale=colorscale,
+            cmin=pace_min,
+            cmax=pace_max,
+            showscale=False,
+        ),
+        hovertemplate="Date: %{x}<br>Pace: %{text}<extra></extra>",
+        text=pace_text,
+    ))
+    # Trace 1 (invisible legend ref): Faster
+    fig_reg.add_trace(go.Scatter(
+        x=[None], y=[None], mode="markers",
+        marker=dict(size=10, color="green"),
+        name="Faster",
+    ))
+    # Trace 2 (invisible legend ref): Slower
+    fig_reg.add_trace(go.Scatter(
+        x=[None], y=[None], mode="markers",
+        marker=dict(size=10, color="red"),
+        name="Slower",
+    ))
+    # Trace 3: Linear
+    fig_reg.add_trace(go.Scatter(
+        x=regression["dates"], y=regression["trend_y"].astype(np.float32),
+        mode="lines", name=f"Linear (R\u00b2={regression['r_squared']:.2f})",
+        line=dict(color="red", width=2, dash="dash"),
+    ))
+    # Trace 4: Polynomial
+    fig_reg.add_trace(go.Scatter(
+        x=regression["dates"], y=regression["poly_y"].astype(np.float32),
+        mode="lines", name=f"Polynomial deg {regression['poly_degree']} (R\u00b2={regression['poly_r_squared']:.2f})",
+        line=dict(color="#9C27B0", width=2.5),
+    ))
+    # Trace 5: Rolling Avg
+    fig_reg.add_trace(go.Scatter(
+        x=regression["dates"], y=regression["rolling_avg"].astype(np.float32),
+        mode="lines", name="10-workout Rolling Avg",
+        line=dict(color="#03A9F4", width=2),
+    ))
+    # M:SS y-axis
+    rtickv, rtickt = pace_ticks(pace_np, step=5)
+    direction = "Getting Faster" if regression["improving"] else "Getting Slower"
+    fig_reg.add_annotation(
+        x=0.02, y=0.98, xref="paper", yref="paper",
+        text=f"<b>Rate:</b> {abs(regression['pace_change_per_month']):.1f}s /500m per month<br><b>{direction}</b>",
+        showarrow=False, bgcolor="rgba(255,255,255,0.8)", bordercolor="#ccc",
+        font=dict(size=12), align="left",
+    )
+    fig_reg.update_layout(
+        title="Pace Trend \u2014 Linear & Polynomial Regression",
+        xaxis_title="Date", yaxis_title="Pace /500m",
+        yaxis=dict(tickvals=rtickv, ticktext=rtickt),
+        template="plotly_white", height=500,
+        legend=dict(x=0.02, y=0.02, bgcolor="rgba(255,255,255,0.8)"),
+    )
+    charts["regression"] = pio.to_json(fig_reg, validate=False)
+    return charts
+
+
+def _clustering_chart(clustering: dict) -> dict[str, str]:
+    """Cluster scatter grid and training-balance pie."""
+    charts = {}
+    # Fixed colors mapped to labels (left→right = Sprint → Endurance)
+    label_colors = {
+        "Sprint": "#FFC107",
+        "5K Steady-State": "#2196F3",
+        "Mid-Distance (5-10K)": "#9C27B0",
+        "10K Steady-State": "#FF5722",
+        "Endurance 10K+": "#4CAF50",
+    }
+    # Variant shades for "(High Intensity)" suffixed labels
+    label_colors_hi = {
+        "Sprint": "#FFD54F",
+        "5K Steady-State": "#64B5F6",
+        "Mid-Distance (5-10K)": "#BA68C8",
+        "10K Steady-State": "#FF8A65",
+        "Endurance 10K+": "#81C784",
+    }
+    def _get_color(label, idx):
+        if label in label_colors:
+            return label_colors[label]
+        # Check for "(High Intensity)" variant
+        base = label.replace(" (High Intensity)", "")
+        if base in label_colors_hi:
+            return label_colors_hi[base]
+        return ["#00BCD4", "#E91E63", "#795548", "#607D8B"][idx % 4]
+
+    # Cluster scatter (Distance vs Pace)
+    fig_cl = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=["Distance vs Pace", "Distance vs Duration",
+                        "Distance vs Stroke Rate", "Distance vs Calories"],
+        horizontal_spacing=0.12, vertical_spacing=0.12,
+    )
+    # Split the points into per-cluster columns in a single pass
+    by_cluster = defaultdict(lambda: {
+        "dists": [], "paces": [], "tmins": [],
+        "spms": [], "dists_spm": [], "cals": [], "dists_cal": [],
+    })
+    # The same pass tracks the pace extremes for the M:SS axis ticks
+    pace_lo, pace_hi = float("inf"), float("-inf")
+    for p in clustering["scatter_data"]:
+        cols = by_cluster[p["cluster"]]
+        pace = p["pace"]
+        if pace < pace_lo:
+            pace_lo = pace
+        if pace > pace_hi:
+            pace_hi = pace
+        cols["dists"].append(p["distance"])
+        cols["paces"].append(pace)
+        cols["tmins"].append(p["time_min"])
+        if p["stroke_rate"] is not None:
+            cols["spms"].append(p["stroke_rate"])
+            cols["dists_spm"].append(p["distance"])
+        if p["calories"] is not None:
+            cols["cals"].append(p["calories"])
+            cols["dists_cal"].append(p["distance"])
+
+    # Profiles are already sorted by distance in analytics.py
+    for i, profile in enumerate(clustering["cluster_profiles"]):
+        cid = profile["id"]
+        cols = by_cluster[cid]
+        color = _get_color(profile["label"], i)
+        # float32 ndarrays serialise as compact base64 typed arrays
+        dists, paces, tmins, spms, dists_spm, cals, dists_cal = (
+            np.asarray(cols[key], dtype=np.float32)
+            for key in ("dists", "paces", "tmins", "spms", "dists_spm", "cals", "dists_cal")
+        )
+        show_legend = True
+        fig_cl.add_trace(go.Scatter(
+            x=dists, y=paces, mode="markers",
+            name=profile["label"],
+            marker=dict(size=8, color=color, opacity=0.7),
+            legendgroup=f"c{cid}", showlegend=show_legend,
+        ), row=1, col=1)
+        fig_cl.add_trace(go.Scatter(
+            x=dists, y=tmins, mode="markers",
+            name=profile["label"],
+            marker=dict(size=8, color=color, opacity=0.7),
+            legendgroup=f"c{cid}", showlegend=False,
+        ), row=1, col=2)
+        if spms.size:
+            fig_cl.add_trace(go.Scatter(
+                x=dists_spm, y=spms, mode="markers",
+                name=profile["label"],
+                marker=dict(size=8, color=color, opacity=0.7),
+                legendgroup=f"c{cid}", showlegend=False,
+            ), row=2, col=1)
+        if cals.size:
+            fig_cl.add_trace(go.Scatter(
+                x=dists_cal, y=cals, mode="markers",
+                name=profile["label"],
+                marker=dict(size=8, color=color, opacity=0.7),
+                legendgroup=f"c{cid}", showlegend=False,
+            ), row=2, col=2)
+    # M:SS on top-left y-axis
+    ctickv, ctickt = pace_ticks(np.array([pace_lo, pace_hi]), step=10)
+    fig_cl.update_xaxes(title_text="Distance (m)", row=1, col=1)
+    fig_cl.update_xaxes(title_text="Distance (m)", row=1, col=2)
+    fig_cl.update_xaxes(title_text="Distance (m)", row=2, col=1)
+    fig_cl.update_xaxes(title_text="Distance (m)", row=2, col=2)
+    fig_cl.update_yaxes(title_text="Pace /500m", tickvals=ctickv, ticktext=ctickt, row=1, col=1)
+    fig_cl.update_yaxes(title_text="Duration (min)", row=1, col=2)
+    fig_cl.update_yaxes(title_text="Stroke Rate (spm)", row=2, col=1)
+    fig_cl.update_yaxes(title_text="Calories (cal)", row=2, col=2)
+    fig_cl.update_layout(
+        title="Workout Clusters — K-Means",
+        template="plotly_white", height=900, width=1000,
+    )
+    charts["clustering"] = pio.to_json(fig_cl, validate=False)
+
+    # Pie chart for training balance (uses distance-based categories)
+    cat_profiles = clustering.get("category_profiles", clustering["cluster_profiles"])
+    labels = [p["label"] for p in cat_profiles]
+    counts = [p["count"] for p in cat_profiles]
+    colors_pie = [_get_color(p["label"], i) for i, p in enumerate(cat_profiles)]
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=labels, values=counts,
+        marker=dict(colors=colors_pie),
+        textinfo="label+percent",
+    )])
+    fig_pie.update_layout(title="Training Balance", template="plotly_white")
+    charts["cluster_pie"] = pio.to_json(fig_pie, validate=False)
+    return charts
 
 
 # ──────────────────────────────────────────────
 # API endpoints (JSON)
 # ──────────────────────────────────────────────
 @app.get("/export/csv")
-async def export_csv(request: Request):
-    """Export all workouts to a CSV file and save to project folder.
-    
-    Visit http://localhost:8000/export/csv while logged in.
-    This saves workouts.csv for use in the Jupyter notebook tutorial.
+async def export_csv(request: Request, save: bool = False):
+    """Download all workouts as CSV, streamed straight from SQLite.
+
+    With ``?save=1`` the file is instead written to workouts.csv in the
+    project folder for use in the Jupyter notebook tutorial.
     """
     token = request.session.get("access_token")
     if not token:
         return RedirectResponse("/auth/login")
 
-    results = load_workouts_as_models()
-    df = results_to_dataframe(results)
-    df.to_csv("workouts.csv", index=False)
-    logger.info(f"Exported {len(df)} workouts to workouts.csv")
-    return HTMLResponse(
-        f"<h2>✅ Exported {len(df)} workouts to workouts.csv</h2>"
-        "<p>You can now load this file in your Jupyter notebook.</p>"
-        '<p><a href="/dashboard">← Back to Dashboard</a></p>'
+    if save:
+        with open("workouts.csv", "w", newline="") as f:
+            writer = csv.writer(f)
+            batches = iter_export_rows()
+            writer.writerows(next(batches))  # header
+            count = 0
+            for rows in batches:
+                writer.writerows(rows)
+                count += len(rows)
+        logger.info(f"Exported {count} workouts to workouts.csv")
+        return HTMLResponse(
+            f"<h2>✅ Exported {count} workouts to workouts.csv</h2>"
+            "<p>You can now load this file in your Jupyter notebook.</p>"
+            '<p><a href="/dashboard">← Back to Dashboard</a></p>'
+        )
+
+    def generate():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for rows in iter_export_rows():
+            writer.writerows(rows)
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=workouts.csv"},
     )
 
 
+def _store_all_workouts(results: list[WorkoutResult]) -> tuple[int, int]:
+    """Write a full re-sync and return ``(rows written, total stored)``."""
+    return store_workouts(results), get_workout_count()
+
+
 @app.get("/sync/force")
 async def force_sync(request: Request):
     """Force a full re-sync from the Concept2 API, bypassing the 24h check."""
@@ -540,17 +863,12 @@ async def force_sync(request: Request):
     if not token:
         return RedirectResponse("/auth/login")
 
-    client = Concept2Client(access_token=token)
     # Fetch ALL workouts fresh
-    results = await client.get_all_results(workout_type="rower")
+    async with Concept2Client(access_token=token, client=request.app.state.http) as client:
+        results = await client.get_all_results(workout_type="rower")
 
-    from .database import _get_connection, _upsert_workouts, _update_sync_meta
-    conn = _get_connection()
-    count = _upsert_workouts(conn, results)
-    _update_sync_meta(conn)
-    conn.commit()
-    total = conn.execute("SELECT COUNT(*) FROM workouts").fetchone()[0]
-    conn.close()
+    # SQLite writes block; keep them off the event loop
+    count, total = await asyncio.to_thread(_store_all_workouts, results)
 
     logger.info(f"Force sync: {count} workouts written, {total} total.")
     return RedirectResponse("/dashboard")
@@ -567,17 +885,38 @@ async def api_results(
     if not token:
         return {"error": "Not authenticated"}, 401
 
-    results = load_workouts_as_models(from_date=from_date, to_date=to_date)
-    return {"count": len(results), "data": [r.model_dump() for r in results]}
+    # Stream the array a batch at a time so memory stays flat however
+    # many workouts match; rows are JSON-native and go straight to orjson
+    def generate():
+        rows = iter_workout_dicts(from_date=from_date, to_date=to_date)
+        yield b'{"count":%d,"data":[' % next(rows)
+        sep = b""
+        for batch in rows:
+            yield sep + b",".join(orjson.dumps(r) for r in batch)
+            sep = b","
+        yield b"]}"
+
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 @app.get("/api/summary")
-async def api_summary(request: Request):
+async def api_summary(
+    request: Request,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+):
     """Return summary statistics as JSON."""
     token = request.session.get("access_token")
     if not token:
         return {"error": "Not authenticated"}, 401
 
-    results = load_workouts_as_models()
-    df = results_to_dataframe(results)
-    return compute_summary(df)
+    # A cache miss loads the workouts: keep it off the event loop
+    summary = _current_summary(await asyncio.to_thread(
+        _summary_payload, from_date or None, to_date or None, get_data_version()
+    ))
+    # Encoded here so FastAPI skips its jsonable_encoder walk; orjson
+    # serialises the NumPy scalars in the summary itself
+    return Response(
+        orjson.dumps(summary, option=orjson.OPT_SERIALIZE_NUMPY),
+        media_type="application/json",
+    )
@@ -94,13 +94,12 @@ class WorkoutResult(BaseModel):
 
     @property
     def date_parsed(self) -> datetime:
-        """Parse date string to datetime."""
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(self.date, fmt)
-            except ValueError:
-                continue
-        return datetime.strptime(self.date[:10], "%Y-%m-%d")
+        """Parse date string to a naive datetime."""
+        try:
+            # One C-level parse for both "YYYY-MM-DD HH:MM:SS" and "YYYY-MM-DD"
+            return datetime.fromisoformat(self.date[:19])
+        except ValueError:
+            return datetime.strptime(self.date[:10], "%Y-%m-%d")
 
 
 # ──────────────────────────────────────────────